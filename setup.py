@@ -46,10 +46,18 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.2.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.0.0",
         ],
+        # Faster HTML parsing and entity matching; the pure Python paths
+        # are used when these are not installed
+        "fast": [
+            "selectolax>=0.3.17",
+            "hyperscan>=0.4.0",
+            "google-re2>=1.1",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -9,26 +9,37 @@ Version: 1.0.0
 Created: 2024-01-15
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "em7admin"
 __description__ = "MS Outlook Email Extraction and Analysis Tool"
 
-# Import main classes for easier access
-try:
-    from .core.outlook_connector import OutlookConnector
-    from .core.dataframe_manager import DataFrameManager
-    from .core.email_processor import EmailProcessor
-    from .processors.text_processor import TextProcessor
-    
-    __all__ = [
-        'OutlookConnector',
-        'DataFrameManager', 
-        'EmailProcessor',
-        'TextProcessor'
-    ]
-except ImportError:
-    # Handle import errors gracefully for development/testing
-    __all__ = []
+# Import main classes for easier access. They are loaded on first use, so
+# importing one submodule (as the CLI does) does not pull in pandas and the
+# COM bindings with every other class.
+_LAZY_IMPORTS = {
+    'OutlookConnector': '.core.outlook_connector',
+    'DataFrameManager': '.core.dataframe_manager',
+    'EmailProcessor': '.core.email_processor',
+    'EmailRecord': '.core.email_record',
+    'ProcessedEmailRecord': '.core.email_record',
+    'TextProcessor': '.processors.text_processor',
+    'Outlook2AI': '.main',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+def __getattr__(name):
+    """Import an exported class from its submodule on first access."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 # Package metadata
 __package_info__ = {
@@ -39,13 +50,17 @@ __package_info__ = {
     'python_requires': '>=3.6',
     'platforms': ['Windows'],
     'dependencies': [
-        'pandas>=1.2.0',
+        'pandas>=2.0.0',
         'pywin32>=300',
         'pyyaml>=5.4.0',
         'beautifulsoup4>=4.9.0'
     ],
     'optional_dependencies': [
         'nltk>=3.6',
-        'textstat>=0.7.0'
+        'textstat>=0.7.0',
+        'pyarrow>=12.0.0',
+        'selectolax>=0.3.17',
+        'hyperscan>=0.4.0',
+        'google-re2>=1.1'
     ]
 }
@@ -4,16 +4,26 @@ Core module for Outlook2AI.
 This module contains the core components for MS Outlook integration and email processing.
 """
 
-try:
-    from .outlook_connector import OutlookConnector
-    from .dataframe_manager import DataFrameManager
-    from .email_processor import EmailProcessor
-    
-    __all__ = [
-        'OutlookConnector',
-        'DataFrameManager',
-        'EmailProcessor'
-    ]
-except ImportError:
-    # Handle import errors gracefully
-    __all__ = []
+import importlib
+
+# Core classes, loaded from their submodules on first use
+_LAZY_IMPORTS = {
+    'OutlookConnector': '.outlook_connector',
+    'DataFrameManager': '.dataframe_manager',
+    'EmailProcessor': '.email_processor',
+    'EmailRecord': '.email_record',
+    'ProcessedEmailRecord': '.email_record',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+def __getattr__(name):
+    """Import an exported class from its submodule on first access."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
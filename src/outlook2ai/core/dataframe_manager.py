@@ -7,41 +7,128 @@ optimized for LLM analysis.
 
 import pandas as pd
 import numpy as np
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Set, Iterable, Tuple, Union
 import logging
 import json
+import os
+from operator import attrgetter
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+from outlook2ai.core.email_record import EmailRecord, EMAIL_RECORD_FIELDS
+from outlook2ai.processors.text_processor import TextProcessor
+
+# Frames smaller than this extract entities in-process, where starting a
+# process pool would cost more than it saves
+_PARALLEL_MIN_ROWS = 200
+_MIN_CHUNK_ROWS = 64
+
+def _utc_offset_ns(hour: int) -> int:
+    """Get the local UTC offset, in nanoseconds, at an epoch hour."""
+    try:
+        offset = datetime.fromtimestamp(hour * 3600, timezone.utc).astimezone().utcoffset()
+    except (OverflowError, OSError, ValueError):
+        return 0
+    return int(offset.total_seconds()) * 1_000_000_000
+
+
+def _to_local_wall_clock(times: pd.Series) -> pd.Series:
+    """
+    Convert UTC times to naive local wall-clock times.
+    
+    The local offset is looked up once per distinct UTC hour, since zone
+    transitions fall on the hour, which is far cheaper than tz_convert
+    with the local zone. Missing times stay missing.
+    
+    Args:
+        times: UTC datetime Series
+        
+    Returns:
+        pd.Series: Naive datetime64[ns] Series of local times
+    """
+    values = times.to_numpy(dtype='datetime64[ns]').view('int64').copy()
+    present = values != np.iinfo(np.int64).min
+    hours, inverse = np.unique(values[present] // 3_600_000_000_000, return_inverse=True)
+    offsets = np.fromiter(map(_utc_offset_ns, hours.tolist()), dtype='int64', count=len(hours))
+    values[present] += offsets[inverse]
+    return pd.Series(values.view('datetime64[ns]'), index=times.index)
+
+
+def _extract_entity_columns(texts: List[str]) -> Tuple[List[List[str]], List[List[str]], List[List[str]]]:
+    """
+    Extract email addresses, phone numbers and URLs from a slice of bodies.
+    
+    Defined at module level so process pool workers can run it.
+    
+    Args:
+        texts: Cleaned body texts
+        
+    Returns:
+        Tuple of per-body email address, phone number and URL lists
+    """
+    text_processor = TextProcessor()
+    series = pd.Series(texts, dtype=object)
+    return (
+        text_processor.extract_email_addresses_series(series).tolist(),
+        text_processor.extract_phone_numbers_series(series).tolist(),
+        text_processor.extract_urls_series(series).tolist(),
+    )
 
 class DataFrameManager:
     """Manages email data in DataFrame format for analysis and LLM processing."""
     
-    def __init__(self):
-        """Initialize DataFrame manager."""
+    def __init__(self, include_html_body: bool = False, extract_entities: bool = False,
+                 text_workers: Optional[int] = None):
+        """
+        Initialize DataFrame manager.
+        
+        Args:
+            include_html_body: Keep body_html as a DataFrame column. When False
+                the HTML is held outside the frame and read via get_html_body.
+            extract_entities: Add email_addresses, phone_numbers and urls
+                columns found in the cleaned body text
+            text_workers: Processes used for entity extraction on large
+                frames (None for one per CPU core)
+        """
         self.logger = logging.getLogger(__name__)
         self.df = None
+        self.include_html_body = include_html_body
+        self.extract_entities = extract_entities
+        self.text_workers = text_workers or os.cpu_count() or 1
+        self.text_processor = TextProcessor()
+        self.html_bodies: List[str] = []
+        self.string_dtype = 'string[pyarrow]' if pa is not None else 'str'
         self.column_definitions = self._get_column_definitions()
+        if not include_html_body:
+            del self.column_definitions['body_html']
+        self._columns_by_dtype = self._group_columns_by_dtype()
     
     def _get_column_definitions(self) -> Dict[str, str]:
         """Define standard columns for email DataFrame."""
         return {
             # Core email fields
-            'folder_name': 'str',
+            'folder_name': 'category',
             'subject': 'str',
-            'sender_email': 'str',
-            'sender_name': 'str',
+            'sender_email': 'category',
+            'sender_name': 'category',
             'received_time': 'datetime64[ns]',
             'sent_time': 'datetime64[ns]',
             'body_text': 'str',
             'body_html': 'str',
             
             # Metadata fields
-            'importance': 'int64',
+            'importance': 'uint8',
             'size': 'int64',
             'unread': 'bool',
             'has_attachments': 'bool',
-            'attachment_count': 'int64',
+            'attachment_count': 'uint16',
             'categories': 'str',
-            'message_class': 'str',
+            'message_class': 'category',
             'conversation_topic': 'str',
             'to_recipients': 'str',
             'cc_recipients': 'str',
@@ -52,55 +139,95 @@ class DataFrameManager:
             'subject_length': 'int64',
             'is_reply': 'bool',
             'is_forward': 'bool',
-            'domain': 'str',
-            'hour_received': 'int64',
-            'day_of_week': 'str',
+            'domain': 'category',
+            'hour_received': 'uint8',
+            'day_of_week': 'category',
             
             # Analysis fields (to be populated by LLM)
-            'sentiment': 'str',
+            'sentiment': 'category',
             'priority_score': 'float64',
-            'topic_category': 'str',
+            'topic_category': 'category',
             'requires_action': 'bool',
             'key_entities': 'str',
             'summary': 'str',
         }
     
-    def create_dataframe(self, email_data: List[Dict[str, Any]]) -> pd.DataFrame:
+    def _group_columns_by_dtype(self) -> Dict[str, List[str]]:
+        """Group the standard columns by the conversion they need."""
+        groups = {'datetime': [], 'bool': [], 'int': [], 'float': [], 'category': [], 'str': []}
+        for column, dtype in self.column_definitions.items():
+            if 'datetime' in dtype:
+                groups['datetime'].append(column)
+            elif dtype == 'bool':
+                groups['bool'].append(column)
+            elif 'int' in dtype:
+                groups['int'].append(column)
+            elif 'float' in dtype:
+                groups['float'].append(column)
+            elif dtype == 'category':
+                groups['category'].append(column)
+            else:
+                groups['str'].append(column)
+        return groups
+    
+    def create_dataframe(self, email_data: Union[List[EmailRecord], List[Dict[str, Any]], Dict[str, List[Any]]]) -> pd.DataFrame:
         """
         Create DataFrame from email data.
         
         Args:
-            email_data: List of email dictionaries
+            email_data: List of EmailRecords or email dictionaries, or one
+                list per column as produced by OutlookConnector.iter_email_batches
             
         Returns:
             pd.DataFrame: Processed email DataFrame
         """
         try:
-            if not email_data:
+            if isinstance(email_data, dict):
+                n_emails = len(next(iter(email_data.values()), ()))
+            else:
+                n_emails = len(email_data)
+            
+            if not n_emails:
                 self.logger.warning("No email data provided")
                 return pd.DataFrame()
             
-            self.logger.info(f"Creating DataFrame from {len(email_data)} emails")
+            self.logger.info("Creating DataFrame from %d emails", n_emails)
             
-            # Create initial DataFrame
-            self.df = pd.DataFrame(email_data)
+            # Create initial DataFrame from per-column arrays. They are built
+            # fresh for this frame, so pandas need not copy them again.
+            self.df = pd.DataFrame(self._records_to_columns(email_data), copy=False)
+            incoming_columns = set(self.df.columns) & set(self.column_definitions)
             
-            # Ensure all required columns exist
+            # Ensure all required columns exist, adding them in a single concat
+            # so the frame is not fragmented by one block insert per column.
+            # These are created in their final dtype and need no conversion.
+            n_rows = len(self.df)
+            missing_columns = {}
             for column, dtype in self.column_definitions.items():
                 if column not in self.df.columns:
                     if dtype == 'str':
-                        self.df[column] = ''
+                        missing_columns[column] = pd.array(np.full(n_rows, '', dtype=object), dtype=self.string_dtype)
+                    elif dtype == 'category':
+                        missing_columns[column] = pd.Categorical.from_codes(
+                            np.zeros(n_rows, dtype='int8'), categories=['']
+                        )
                     elif dtype == 'bool':
-                        self.df[column] = False
+                        missing_columns[column] = np.zeros(n_rows, dtype=bool)
                     elif 'int' in dtype:
-                        self.df[column] = 0
+                        missing_columns[column] = np.zeros(n_rows, dtype=dtype)
                     elif 'float' in dtype:
-                        self.df[column] = 0.0
+                        missing_columns[column] = np.zeros(n_rows, dtype='float64')
                     elif 'datetime' in dtype:
-                        self.df[column] = pd.NaT
-            
-            # Apply data type conversions
-            self._apply_data_types()
+                        missing_columns[column] = np.full(n_rows, np.datetime64('NaT'), dtype='datetime64[ns]')
+
+            if missing_columns:
+                self.df = pd.concat(
+                    [self.df, pd.DataFrame(missing_columns, index=self.df.index)],
+                    axis=1
+                )
+
+            # Apply data type conversions to the columns supplied by the caller
+            self._apply_data_types(incoming_columns)
             
             # Clean and process data
             self._clean_data()
@@ -108,111 +235,243 @@ class DataFrameManager:
             # Add computed fields
             self._add_computed_fields()
             
-            self.logger.info(f"DataFrame created successfully with shape: {self.df.shape}")
+            if self.extract_entities:
+                self._add_entity_fields()
+            
+            self.logger.info("DataFrame created successfully with shape: %s", self.df.shape)
             return self.df
             
         except Exception as e:
             self.logger.error(f"Error creating DataFrame: {str(e)}")
             return pd.DataFrame()
     
-    def _apply_data_types(self):
-        """Apply proper data types to DataFrame columns."""
-        try:
-            for column, dtype in self.column_definitions.items():
-                if column in self.df.columns:
-                    if dtype == 'datetime64[ns]':
-                        self.df[column] = pd.to_datetime(self.df[column], errors='coerce')
-                    elif dtype == 'bool':
-                        self.df[column] = self.df[column].astype(bool)
-                    elif 'int' in dtype:
-                        self.df[column] = pd.to_numeric(self.df[column], errors='coerce').fillna(0).astype('int64')
-                    elif 'float' in dtype:
-                        self.df[column] = pd.to_numeric(self.df[column], errors='coerce').fillna(0.0)
-                    else:  # string types
-                        self.df[column] = self.df[column].astype(str).fillna('')
-                        
-        except Exception as e:
-            self.logger.error(f"Error applying data types: {str(e)}")
+    def _records_to_columns(self, email_data: Union[List[EmailRecord], List[Dict[str, Any]], Dict[str, List[Any]]]) -> Dict[str, Any]:
+        """
+        Transpose email records into per-column arrays.
+        
+        Columnar input is used as is. Standard columns are passed as object
+        arrays so pandas does not run type inference on values that
+        _apply_data_types converts anyway; any other fields are left for
+        pandas to infer. The bulky HTML bodies are kept out of the frame
+        unless include_html_body is set.
+        
+        Args:
+            email_data: List of EmailRecords or email dictionaries, or one list per column
+            
+        Returns:
+            Dict[str, Any]: Column name to column values
+        """
+        if isinstance(email_data, dict):
+            column_values = dict(email_data)
+        elif email_data and isinstance(email_data[0], EmailRecord):
+            rows = map(attrgetter(*EMAIL_RECORD_FIELDS), email_data)
+            column_values = dict(zip(EMAIL_RECORD_FIELDS, map(list, zip(*rows))))
+        else:
+            keys = dict.fromkeys(key for email in email_data for key in email)
+            column_values = {key: [email.get(key) for email in email_data] for key in keys}
+        index = pd.RangeIndex(len(next(iter(column_values.values()), ())))
+        
+        self.html_bodies = []
+        if not self.include_html_body and 'body_html' in column_values:
+            self.html_bodies = list(column_values.pop('body_html'))
+        
+        columns = {}
+        for key, values in column_values.items():
+            if key in self.column_definitions:
+                columns[key] = pd.Series(values, index=index, dtype=object)
+            else:
+                columns[key] = values
+        return columns
+    
+    def _apply_data_types(self, columns: Optional[Set[str]] = None):
+        """
+        Apply proper data types to DataFrame columns.
+        
+        Args:
+            columns: Columns to convert (None for every column present)
+        """
+        if columns is None:
+            columns = set(self.df.columns)
+        
+        present = {
+            group: [col for col in group_columns if col in columns]
+            for group, group_columns in self._columns_by_dtype.items()
+        }
+        
+        # Parse datetime columns that are not datetime64 yet (raw COM times,
+        # datetime objects or ISO strings) in one call each. Both producers
+        # hand over true UTC (the connector reads times by MAPI proptag,
+        # EmailProcessor converts local fallbacks), and utc=True also copes
+        # with every COM value carrying its own tzinfo instance.
+        for column in present['datetime']:
+            if not pd.api.types.is_datetime64_any_dtype(self.df[column]):
+                self.df[column] = pd.to_datetime(
+                    self.df[column], errors='coerce', cache=True, format='ISO8601', utc=True
+                )
+        
+        if present['bool']:
+            cols = present['bool']
+            self.df[cols] = self.df[cols].astype(bool)
+        
+        if present['int']:
+            cols = present['int']
+            int_dtypes = {col: self.column_definitions[col] for col in cols}
+            self.df[cols] = self.df[cols].apply(pd.to_numeric, errors='coerce').fillna(0).astype(int_dtypes)
+        
+        if present['float']:
+            cols = present['float']
+            self.df[cols] = self.df[cols].apply(pd.to_numeric, errors='coerce').fillna(0.0)
+        
+        if present['category']:
+            cols = present['category']
+            self.df[cols] = self.df[cols].astype(str).fillna('').astype('category')
+        
+        # Text columns use Arrow-backed strings when pyarrow is available
+        if present['str']:
+            cols = present['str']
+            self.df[cols] = self.df[cols].astype(str).fillna('').astype(self.string_dtype)
     
     def _clean_data(self):
         """Clean and normalize email data."""
-        try:
-            # Clean text fields
-            text_columns = ['subject', 'body_text', 'sender_name', 'sender_email']
-            for col in text_columns:
-                if col in self.df.columns:
-                    self.df[col] = self.df[col].str.strip()
-                    self.df[col] = self.df[col].replace('', np.nan)
-            
-            # Normalize email addresses
-            if 'sender_email' in self.df.columns:
-                self.df['sender_email'] = self.df['sender_email'].str.lower()
-            
-            # Clean HTML from body text if needed
-            if 'body_text' in self.df.columns:
-                self.df['body_text_clean'] = self.df['body_text'].apply(self._clean_text)
-            
-        except Exception as e:
-            self.logger.error(f"Error cleaning data: {str(e)}")
+        # Clean text fields
+        text_columns = ['subject', 'body_text', 'sender_name']
+        for col in text_columns:
+            if col in self.df.columns:
+                cleaned = self.df[col].str.strip().replace('', np.nan)
+                if self.column_definitions[col] == 'category':
+                    cleaned = cleaned.astype('category')
+                self.df[col] = cleaned
+        
+        # Normalize email addresses and derive the sender domain from the
+        # same lowercased Series
+        if 'sender_email' in self.df.columns:
+            sender_email = self.df['sender_email'].str.strip().str.lower()
+            self.df['sender_email'] = sender_email.replace('', np.nan).astype('category')
+            self.df['domain'] = (
+                sender_email.str.split('@', n=1).str[1]
+                .fillna('')
+                .astype('category')
+            )
+        
+        # Collapse whitespace runs (including CR/LF) in one vectorized pass
+        if 'body_text' in self.df.columns:
+            body_text = self.df['body_text'].fillna('').astype(self.string_dtype)
+            body_text_clean = body_text.str.replace(r'\s+', ' ', regex=True).str.strip()
+            
+            # Fall back to the HTML body where there is no plain text, cleaning
+            # only those rows in bulk
+            html_body = self._get_html_series()
+            if html_body is not None:
+                fallback = (body_text_clean == '') & (html_body.fillna('') != '')
+                if fallback.any():
+                    body_text_clean = body_text_clean.where(
+                        ~fallback, self.text_processor.clean_html_series(html_body[fallback])
+                    )
+            self.df['body_text_clean'] = body_text_clean
     
-    def _clean_text(self, text: str) -> str:
-        """Clean text content for better analysis."""
-        if pd.isna(text) or text == '':
-            return ''
+    def _get_html_series(self) -> Optional[pd.Series]:
+        """Get the HTML bodies aligned with the frame, wherever they are held."""
+        if 'body_html' in self.df.columns:
+            return self.df['body_html']
+        if len(self.html_bodies) == len(self.df):
+            return pd.Series(self.html_bodies, index=self.df.index, dtype=object)
+        return None
+    
+    def _add_entity_fields(self):
+        """Add the email addresses, phone numbers and URLs in each body."""
+        if 'body_text_clean' not in self.df.columns:
+            return
+        texts = self.df['body_text_clean'].fillna('').astype(str).tolist()
         
-        try:
-            # Remove excessive whitespace
-            text = ' '.join(text.split())
-            
-            # Remove common email artifacts
-            text = text.replace('\r\n', '\n').replace('\r', '\n')
-            
-            return text
-            
-        except Exception:
-            return str(text)
+        entities = None
+        if self.text_workers > 1 and len(texts) >= _PARALLEL_MIN_ROWS:
+            # The regex scans are CPU-bound, so spread slices of the bodies
+            # over worker processes
+            size = max(_MIN_CHUNK_ROWS, -(-len(texts) // (self.text_workers * 4)))
+            chunks = [texts[i:i + size] for i in range(0, len(texts), size)]
+            try:
+                with ProcessPoolExecutor(max_workers=min(self.text_workers, len(chunks))) as pool:
+                    results = list(pool.map(_extract_entity_columns, chunks))
+                entities = tuple(
+                    [found for result in results for found in result[i]]
+                    for i in range(3)
+                )
+            except Exception as e:
+                self.logger.warning("Parallel entity extraction failed, running serially: %s", e)
+        
+        if entities is None:
+            entities = _extract_entity_columns(texts)
+        
+        for column, values in zip(('email_addresses', 'phone_numbers', 'urls'), entities):
+            self.df[column] = pd.Series(values, index=self.df.index, dtype=object)
     
     def _add_computed_fields(self):
         """Add computed fields for LLM analysis."""
-        try:
-            # Add email age in days
-            if 'received_time' in self.df.columns:
-                now = pd.Timestamp.now()
-                self.df['age_days'] = (now - self.df['received_time']).dt.days
-            
-            # Add time-based categories
-            if 'hour_received' in self.df.columns:
-                self.df['time_category'] = self.df['hour_received'].apply(self._categorize_time)
-            
-            # Add size categories
-            if 'size' in self.df.columns:
-                self.df['size_category'] = pd.cut(
-                    self.df['size'], 
-                    bins=[0, 1000, 10000, 100000, float('inf')],
-                    labels=['Small', 'Medium', 'Large', 'Very Large']
+        # Add email age in days, using integer nanoseconds rather than a
+        # timedelta Series; missing times stay missing
+        if 'received_time' in self.df.columns:
+            now_ns = pd.Timestamp.now(tz='UTC').as_unit('ns').value
+            received_ns = self.df['received_time'].to_numpy(dtype='datetime64[ns]').view('int64')
+            missing = received_ns == np.iinfo(np.int64).min
+            age_days = (now_ns - received_ns) // 86_400_000_000_000
+            self.df['age_days'] = pd.arrays.IntegerArray(age_days, missing)
+        
+        # Derive the received hour and weekday for the whole frame at once
+        # rather than per email during extraction; times are stored in UTC,
+        # but the hour and weekday describe the user's own day
+        if 'received_time' in self.df.columns and pd.api.types.is_datetime64_any_dtype(self.df['received_time']):
+            received = _to_local_wall_clock(self.df['received_time']).dt
+            self.df['hour_received'] = received.hour.fillna(0).astype(self.column_definitions['hour_received'])
+            self.df['day_of_week'] = received.day_name().fillna('').astype('category')
+        
+        # Add time-based categories
+        if 'hour_received' in self.df.columns:
+            # Bin hours at 6/12/17/21; the last bin wraps round to 'Night'
+            categories = ['Night', 'Morning', 'Afternoon', 'Evening', 'Unknown']
+            hours = self.df['hour_received'].to_numpy(dtype='float64', na_value=np.nan)
+            codes = np.searchsorted([6, 12, 17, 21], hours, side='right') % 4
+            codes[np.isnan(hours)] = 4
+            self.df['time_category'] = pd.Categorical.from_codes(codes, categories=categories)
+        
+        # Add size categories using right-closed bins (0, 1K], (1K, 10K],
+        # (10K, 100K], (100K, inf); non-positive sizes are left missing
+        if 'size' in self.df.columns:
+            sizes = self.df['size'].to_numpy()
+            codes = np.searchsorted([1000, 10000, 100000], sizes, side='left')
+            codes[sizes <= 0] = -1
+            self.df['size_category'] = pd.Categorical.from_codes(
+                codes, categories=['Small', 'Medium', 'Large', 'Very Large'], ordered=True
+            )
+        
+        # Add recipient count
+        for col in ['to_recipients', 'cc_recipients', 'bcc_recipients']:
+            if col in self.df.columns:
+                count_col = col.replace('_recipients', '_count')
+                recipients = self.df[col]
+                self.df[count_col] = (
+                    recipients.str.count(';').add(1)
+                    .where(recipients.str.len() > 0, 0)
+                    .astype('int64')
                 )
-            
-            # Add recipient count
-            for col in ['to_recipients', 'cc_recipients', 'bcc_recipients']:
-                if col in self.df.columns:
-                    count_col = col.replace('_recipients', '_count')
-                    self.df[count_col] = self.df[col].apply(lambda x: len(x.split(';')) if x else 0)
-            
-        except Exception as e:
-            self.logger.error(f"Error adding computed fields: {str(e)}")
     
-    def _categorize_time(self, hour: int) -> str:
-        """Categorize email by time of day."""
-        if pd.isna(hour):
-            return 'Unknown'
-        elif 6 <= hour < 12:
-            return 'Morning'
-        elif 12 <= hour < 17:
-            return 'Afternoon'
-        elif 17 <= hour < 21:
-            return 'Evening'
-        else:
-            return 'Night'
+    def get_html_body(self, index: int) -> str:
+        """
+        Get the HTML body of an email.
+        
+        Args:
+            index: Row index of the email in the DataFrame
+            
+        Returns:
+            str: HTML body, or an empty string if not available
+        """
+        if self.include_html_body:
+            if self.df is None or 'body_html' not in self.df.columns or index not in self.df.index:
+                return ''
+            return self.df.at[index, 'body_html']
+        
+        if 0 <= index < len(self.html_bodies):
+            return self.html_bodies[index] or ''
+        return ''
     
     def get_summary_stats(self) -> Dict[str, Any]:
         """Get summary statistics of the email DataFrame."""
@@ -220,22 +479,32 @@ class DataFrameManager:
             return {}
         
         try:
+            # Compute every per-column reduction in a single agg call; the
+            # result frame is NaN-padded, so integer results are cast back
+            aggregates = self.df.agg({
+                'received_time': ['min', 'max'],
+                'body_word_count': ['mean'],
+                'unread': ['sum'],
+                'has_attachments': ['sum'],
+                'size': ['mean', 'median', 'max'],
+            })
+            
             stats = {
                 'total_emails': len(self.df),
                 'date_range': {
-                    'earliest': self.df['received_time'].min(),
-                    'latest': self.df['received_time'].max()
+                    'earliest': aggregates.at['min', 'received_time'],
+                    'latest': aggregates.at['max', 'received_time']
                 },
                 'folder_distribution': self.df['folder_name'].value_counts().to_dict(),
-                'sender_distribution': self.df['sender_email'].value_counts().head(10).to_dict(),
-                'domain_distribution': self.df['domain'].value_counts().head(10).to_dict(),
-                'avg_body_length': self.df['body_word_count'].mean(),
-                'unread_count': self.df['unread'].sum(),
-                'with_attachments': self.df['has_attachments'].sum(),
+                'sender_distribution': self.df['sender_email'].value_counts().iloc[:10].to_dict(),
+                'domain_distribution': self.df['domain'].value_counts().iloc[:10].to_dict(),
+                'avg_body_length': aggregates.at['mean', 'body_word_count'],
+                'unread_count': int(aggregates.at['sum', 'unread']),
+                'with_attachments': int(aggregates.at['sum', 'has_attachments']),
                 'size_stats': {
-                    'mean': self.df['size'].mean(),
-                    'median': self.df['size'].median(),
-                    'max': self.df['size'].max()
+                    'mean': aggregates.at['mean', 'size'],
+                    'median': aggregates.at['median', 'size'],
+                    'max': int(aggregates.at['max', 'size'])
                 }
             }
             
@@ -271,25 +540,104 @@ class DataFrameManager:
             
             # Filter to existing columns
             available_columns = [col for col in llm_columns if col in self.df.columns]
-            export_df = self.df[available_columns].copy()
-            
-            # Export in requested format
-            if format_type.lower() == 'csv':
-                export_df.to_csv(output_path, index=False, encoding='utf-8')
-            elif format_type.lower() == 'json':
-                export_df.to_json(output_path, orient='records', date_format='iso', indent=2)
-            elif format_type.lower() == 'parquet':
-                export_df.to_parquet(output_path, index=False)
-            else:
+            format_type = format_type.lower()
+            
+            if format_type not in ('csv', 'json', 'parquet'):
                 raise ValueError(f"Unsupported format: {format_type}")
             
-            self.logger.info(f"Data exported successfully to {output_path} in {format_type} format")
+            # Export in requested format, handing columns to Arrow's
+            # multi-threaded writers when pyarrow is available. Writers that
+            # accept a column list read straight from self.df so no subset
+            # frame is built.
+            if format_type == 'json':
+                self.df[available_columns].to_json(output_path, orient='records', date_format='iso', indent=2)
+            elif pa is None:
+                if format_type == 'csv':
+                    self.df.to_csv(output_path, columns=available_columns, index=False, encoding='utf-8')
+                else:
+                    self.df[available_columns].to_parquet(output_path, index=False)
+            else:
+                table = pa.Table.from_pandas(self.df, columns=available_columns, preserve_index=False)
+                if format_type == 'csv':
+                    pa_csv.write_csv(table, output_path)
+                else:
+                    pq.write_table(table, output_path, compression='zstd')
+            
+            self.logger.info("Data exported successfully to %s in %s format", output_path, format_type)
             return True
             
         except Exception as e:
             self.logger.error(f"Error exporting data: {str(e)}")
             return False
     
+    def write_email_stream(self, email_batches: Iterable[Dict[str, List[Any]]], output_path: str,
+                           format_type: str = 'arrow') -> int:
+        """
+        Write batches of email columns straight to an Arrow IPC or Parquet file.
+        
+        Each batch is converted and written as it arrives, so neither a
+        DataFrame nor the full set of emails is held in memory. Standard
+        columns present in the first batch are written, typed as in the
+        DataFrame.
+        
+        Args:
+            email_batches: Iterable of column name to column values mappings,
+                as yielded by OutlookConnector.iter_email_batches
+            output_path: Path of the file to write
+            format_type: 'arrow' for an Arrow IPC file, or 'parquet' to write
+                each batch as a Parquet row group
+            
+        Returns:
+            int: Number of emails written
+        """
+        if pa is None:
+            raise ImportError("pyarrow is required for streaming export")
+        
+        format_type = format_type.lower()
+        if format_type not in ('arrow', 'parquet'):
+            raise ValueError(f"Unsupported stream format: {format_type}")
+        
+        written = 0
+        writer = None
+        try:
+            for batch in email_batches:
+                n_emails = len(next(iter(batch.values()), ()))
+                if not n_emails:
+                    continue
+                if writer is None:
+                    schema = self._get_arrow_schema(batch)
+                    if format_type == 'parquet':
+                        writer = pq.ParquetWriter(output_path, schema)
+                    else:
+                        writer = pa.ipc.new_file(output_path, schema)
+                writer.write_batch(pa.RecordBatch.from_pydict(
+                    {name: batch[name] for name in schema.names}, schema=schema
+                ))
+                written += n_emails
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        self.logger.info("Streamed %d emails to %s", written, output_path)
+        return written
+    
+    def _get_arrow_schema(self, columns: Dict[str, List[Any]]) -> 'pa.Schema':
+        """Build the Arrow schema for the standard columns present in columns."""
+        fields = []
+        for column, dtype in self.column_definitions.items():
+            if column not in columns:
+                continue
+            if 'datetime' in dtype:
+                arrow_type = pa.timestamp('us', tz='UTC')
+            elif dtype in ('category', 'str'):
+                # IPC files allow one dictionary per field, so categories
+                # that grow batch by batch are written as plain strings
+                arrow_type = pa.string()
+            else:
+                arrow_type = pa.from_numpy_dtype(np.dtype(dtype))
+            fields.append(pa.field(column, arrow_type))
+        return pa.schema(fields)
+    
     def prepare_llm_prompt_data(self, max_emails: int = 100) -> str:
         """
         Prepare email data for LLM prompt analysis.
@@ -304,8 +652,8 @@ class DataFrameManager:
             if self.df is None or self.df.empty:
                 return "No email data available for analysis."
             
-            # Sample data if too large
-            sample_df = self.df.head(max_emails) if len(self.df) > max_emails else self.df.copy()
+            # Sample data if too large; the sample is only read, so no copy
+            sample_df = self.df.head(max_emails)
             
             # Create summary for LLM
             summary = []
@@ -316,17 +664,21 @@ class DataFrameManager:
             summary.append(f"Folders: {', '.join(sample_df['folder_name'].unique())}")
             summary.append("\nSAMPLE EMAIL DATA:")
             
-            # Add sample emails with key fields
-            for idx, row in sample_df.iterrows():
-                email_summary = []
-                email_summary.append(f"\nEmail {idx + 1}:")
-                email_summary.append(f"  Folder: {row['folder_name']}")
-                email_summary.append(f"  From: {row['sender_email']}")
-                email_summary.append(f"  Subject: {row['subject'][:100]}...")
-                email_summary.append(f"  Received: {row['received_time']}")
-                email_summary.append(f"  Body (first 200 chars): {str(row.get('body_text_clean', ''))[:200]}...")
-                
-                summary.extend(email_summary)
+            # Format every sample email in one vectorized string pass
+            if 'body_text_clean' in sample_df.columns:
+                bodies = sample_df['body_text_clean'].fillna('').astype(str)
+            else:
+                bodies = pd.Series('', index=sample_df.index)
+            numbers = pd.Series(range(1, len(sample_df) + 1), index=sample_df.index).astype(str)
+            blocks = (
+                '\nEmail ' + numbers + ':'
+                + '\n  Folder: ' + sample_df['folder_name'].astype(str)
+                + '\n  From: ' + sample_df['sender_email'].astype(str).fillna('')
+                + '\n  Subject: ' + sample_df['subject'].fillna('').astype(str).str.slice(0, 100) + '...'
+                + '\n  Received: ' + sample_df['received_time'].astype(str).fillna('NaT')
+                + '\n  Body (first 200 chars): ' + bodies.str.slice(0, 200) + '...'
+            )
+            summary.extend(blocks.tolist())
             
             return '\n'.join(summary)
             
@@ -6,20 +6,78 @@ extracting metadata and content for DataFrame creation.
 """
 
 import logging
+import re
+from operator import attrgetter
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional
-import win32com.client
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+from outlook2ai.core.email_record import PROCESSED_EMAIL_FIELDS, ProcessedEmailRecord
 from outlook2ai.processors.text_processor import TextProcessor
 
+# Scalar MAPI properties fetched with a single PropertyAccessor.GetProperties
+# call: (email_data key, property schema name, object model fallback, default)
+_PROPTAG = 'http://schemas.microsoft.com/mapi/proptag/'
+_MAPI_PROPERTIES = (
+    ('subject', _PROPTAG + '0x0037001F', 'Subject', ''),                      # PR_SUBJECT_W
+    ('sender_email_address', _PROPTAG + '0x0C1F001F', 'SenderEmailAddress', ''),  # PR_SENDER_EMAIL_ADDRESS_W
+    ('sender_smtp_address', _PROPTAG + '0x5D01001F', 'SenderEmailAddress', ''),   # PR_SENDER_SMTP_ADDRESS_W
+    ('sender_name', _PROPTAG + '0x0C1A001F', 'SenderName', ''),               # PR_SENDER_NAME_W
+    ('received_time', _PROPTAG + '0x0E060040', 'ReceivedTime', None),         # PR_MESSAGE_DELIVERY_TIME
+    ('sent_time', _PROPTAG + '0x00390040', 'SentOn', None),                   # PR_CLIENT_SUBMIT_TIME
+    ('importance', _PROPTAG + '0x00170003', 'Importance', 1),                 # PR_IMPORTANCE
+    ('size', _PROPTAG + '0x0E080003', 'Size', 0),                             # PR_MESSAGE_SIZE
+    ('unread', _PROPTAG + '0x0E070003', 'UnRead', False),                     # PR_MESSAGE_FLAGS
+    ('message_class', _PROPTAG + '0x001A001F', 'MessageClass', ''),           # PR_MESSAGE_CLASS_W
+    ('conversation_topic', _PROPTAG + '0x0070001F', 'ConversationTopic', ''), # PR_CONVERSATION_TOPIC_W
+    ('email_thread_id', _PROPTAG + '0x30130102', 'ConversationID', ''),       # PR_CONVERSATION_ID
+    ('message_id', _PROPTAG + '0x0FFF0102', 'EntryID', ''),                   # PR_ENTRYID
+    ('categories',                                                            # PR_CATEGORIES (named)
+     'http://schemas.microsoft.com/mapi/string/{00020329-0000-0000-C000-000000000046}/Keywords',
+     'Categories', ''),
+    ('display_to', _PROPTAG + '0x0E04001F', 'To', ''),                        # PR_DISPLAY_TO_W
+    ('display_cc', _PROPTAG + '0x0E03001F', 'CC', ''),                        # PR_DISPLAY_CC_W
+    ('display_bcc', _PROPTAG + '0x0E02001F', 'BCC', ''),                      # PR_DISPLAY_BCC_W
+)
+_MAPI_SCHEMA_NAMES = tuple(schema for _, schema, _, _ in _MAPI_PROPERTIES)
+# Reads every object model fallback in one call when GetProperties is unavailable
+_OBJECT_MODEL_GETTER = attrgetter(*(name for _, _, name, _ in _MAPI_PROPERTIES))
+_MSGFLAG_READ = 0x0001
+
+# GetProperties returns PR_MESSAGE_DELIVERY_TIME and PR_CLIENT_SUBMIT_TIME in
+# UTC, while the ReceivedTime/SentOn fallbacks are local wall-clock times
+_LOCAL_TIME_KEYS = frozenset(('received_time', 'sent_time'))
+
+# Reads every field of a ProcessedEmailRecord in declaration order
+_RECORD_VALUES = attrgetter(*PROCESSED_EMAIL_FIELDS)
+
+# Lowercase subject prefixes marking replies and forwards
+_REPLY_PREFIXES = ('re:', 're :')
+_FORWARD_PREFIXES = ('fw:', 'fwd:', 'fw :')
+
+# Matches a usable SMTP address; Exchange X500 DNs start with '/'
+_VALID_SMTP = re.compile(r'^[^/].*@.+').match
+
+# Priority text indexed by Outlook importance (olImportanceLow/Normal/High)
+_PRIORITY_TEXT = ('Low', 'Normal', 'High')
+
 class EmailProcessor:
     """Processes individual email items and extracts relevant data."""
     
-    def __init__(self):
-        """Initialize email processor."""
+    def __init__(self, include_html_body: bool = False, resolve_recipient_addresses: bool = False):
+        """
+        Initialize email processor.
+        
+        Args:
+            include_html_body: Always fetch HTMLBody, even when the plain text
+                body is enough for processing
+            resolve_recipient_addresses: Enumerate Recipients for names and
+                addresses instead of using the To/CC/BCC display strings
+        """
         self.logger = logging.getLogger(__name__)
+        self.include_html_body = include_html_body
+        self.resolve_recipient_addresses = resolve_recipient_addresses
         self.text_processor = TextProcessor()
         
-    def process_email_item(self, mail_item: Any, folder_name: str) -> Dict[str, Any]:
+    def process_email_item(self, mail_item: Any, folder_name: str) -> ProcessedEmailRecord:
         """
         Process a single email item and extract all relevant data.
         
@@ -28,77 +86,185 @@ class EmailProcessor:
             folder_name: Name of the folder containing the email
             
         Returns:
-            Dict[str, Any]: Dictionary containing all email data
+            ProcessedEmailRecord: All email data
         """
         try:
-            email_data = {}
+            properties = self._get_mapi_properties(mail_item)
+            subject = properties['subject']
             
-            # Basic email information
-            email_data['folder_name'] = folder_name
-            email_data['subject'] = self._safe_get_property(mail_item, 'Subject', '')
-            email_data['sender_email'] = self._extract_sender_email(mail_item)
-            email_data['sender_name'] = self._safe_get_property(mail_item, 'SenderName', '')
+            # Body content; HTMLBody is only fetched when the plain text body
+            # is unusable or the HTML is wanted downstream
+            body_text = self._safe_get_property(mail_item, 'Body', '')
+            body_html = None
             
-            # Date/time information
-            email_data['received_time'] = self._convert_outlook_time(
-                self._safe_get_property(mail_item, 'ReceivedTime')
-            )
-            email_data['sent_time'] = self._convert_outlook_time(
-                self._safe_get_property(mail_item, 'SentOn')
-            )
+            def fetch_html_body() -> str:
+                nonlocal body_html
+                body_html = self._safe_get_property(mail_item, 'HTMLBody', '')
+                return body_html
             
-            # Body content
-            email_data['body_html'] = self._safe_get_property(mail_item, 'HTMLBody', '')
-            email_data['body_text'] = self._safe_get_property(mail_item, 'Body', '')
+            html_body = fetch_html_body() if self.include_html_body else fetch_html_body
             
             # Process body content
-            processed_body = self.text_processor.process_email_body(
-                email_data['body_html'],
-                email_data['body_text']
-            )
-            email_data.update(processed_body)
-            
-            # Email metadata
-            email_data['importance'] = self._safe_get_property(mail_item, 'Importance', 1)
-            email_data['size'] = self._safe_get_property(mail_item, 'Size', 0)
-            email_data['unread'] = self._safe_get_property(mail_item, 'UnRead', False)
-            email_data['message_class'] = self._safe_get_property(mail_item, 'MessageClass', '')
-            email_data['conversation_topic'] = self._safe_get_property(mail_item, 'ConversationTopic', '')
+            processed_body = self.text_processor.process_email_body(html_body, body_text)
             
             # Recipients
-            email_data['to_recipients'] = self._extract_recipients(mail_item, 'To')
-            email_data['cc_recipients'] = self._extract_recipients(mail_item, 'CC')
-            email_data['bcc_recipients'] = self._extract_recipients(mail_item, 'BCC')
+            if self.resolve_recipient_addresses:
+                to_recipients, cc_recipients, bcc_recipients = self._extract_recipients(mail_item)
+            else:
+                to_recipients = properties['display_to']
+                cc_recipients = properties['display_cc']
+                bcc_recipients = properties['display_bcc']
             
             # Attachments
             attachment_info = self._process_attachments(mail_item)
-            email_data['has_attachments'] = attachment_info['has_attachments']
-            email_data['attachment_count'] = attachment_info['attachment_count']
-            email_data['attachment_names'] = attachment_info['attachment_names']
-            email_data['attachment_sizes'] = attachment_info['attachment_sizes']
-            
-            # Categories
-            email_data['categories'] = self._extract_categories(mail_item)
-            
-            # Additional computed fields for LLM analysis
-            email_data['email_thread_id'] = self._safe_get_property(mail_item, 'ConversationID', '')
-            email_data['message_id'] = self._safe_get_property(mail_item, 'EntryID', '')
             
             # Flags and properties
-            email_data['is_replied'] = self._check_reply_status(mail_item)
-            email_data['is_forwarded'] = self._check_forward_status(mail_item)
-            email_data['priority'] = self._get_priority_text(email_data['importance'])
-            
-            # Time-based analysis
-            email_data['day_of_week'] = email_data['received_time'].strftime('%A') if email_data['received_time'] else ''
-            email_data['hour_of_day'] = email_data['received_time'].hour if email_data['received_time'] else 0
-            
-            return email_data
+            subject_is_reply, is_forwarded = self._classify_subject(subject)
+            importance = properties['importance']
+            
+            # Time-based fields (weekday, hour) are derived from received_time
+            # for the whole batch by DataFrameManager
+            return ProcessedEmailRecord(
+                folder_name=folder_name,
+                subject=subject,
+                # PR_SENDER_SMTP_ADDRESS holds the SMTP address even when
+                # SenderEmailAddress is an Exchange X500 DN
+                sender_email=self._extract_sender_email(
+                    mail_item, properties['sender_smtp_address'] or properties['sender_email_address']
+                ),
+                sender_name=properties['sender_name'],
+                received_time=self._convert_outlook_time(properties['received_time']),
+                sent_time=self._convert_outlook_time(properties['sent_time']),
+                body_text=body_text,
+                body_html=body_html,
+                **processed_body,
+                importance=importance,
+                size=properties['size'],
+                unread=properties['unread'],
+                message_class=properties['message_class'],
+                conversation_topic=properties['conversation_topic'],
+                to_recipients=to_recipients,
+                cc_recipients=cc_recipients,
+                bcc_recipients=bcc_recipients,
+                has_attachments=attachment_info['has_attachments'],
+                attachment_count=attachment_info['attachment_count'],
+                attachment_names=attachment_info['attachment_names'],
+                attachment_sizes=attachment_info['attachment_sizes'],
+                categories=properties['categories'],
+                email_thread_id=properties['email_thread_id'],
+                message_id=properties['message_id'],
+                is_forwarded=is_forwarded,
+                is_replied=self._check_reply_status(mail_item, subject_is_reply),
+                priority=_PRIORITY_TEXT[importance] if importance in (0, 1, 2) else 'Normal',
+            )
             
         except Exception as e:
             self.logger.error(f"Error processing email item: {e}")
             return self._create_error_record(folder_name, str(e))
     
+    def process_email_items(self, mail_items: Iterable[Any], folder_name: str) -> Dict[str, List[Any]]:
+        """
+        Process a batch of email items into columns.
+
+        Each email's record is appended to one list per field as soon as it
+        is processed, so the batch is held as columns rather than a record
+        per email, ready for DataFrameManager.create_dataframe.
+
+        Args:
+            mail_items: Outlook mail item objects
+            folder_name: Name of the folder containing the emails
+
+        Returns:
+            Dict[str, List]: Email data, one list per field
+        """
+        columns: Dict[str, List[Any]] = {name: [] for name in PROCESSED_EMAIL_FIELDS}
+        appenders = [column.append for column in columns.values()]
+        for mail_item in mail_items:
+            for append, value in zip(appenders, _RECORD_VALUES(self.process_email_item(mail_item, folder_name))):
+                append(value)
+        return columns
+
+    def _get_mapi_properties(self, mail_item: Any) -> Dict[str, Any]:
+        """
+        Fetch the scalar properties of a mail item in one COM round trip.
+        
+        Properties that GetProperties cannot return (it reports an HRESULT in
+        their slot) are read through the object model instead. If the bulk
+        fetch fails outright, all properties are read from the object model
+        at once, falling back to one at a time only if one of them fails.
+        
+        Args:
+            mail_item: Outlook mail item object
+            
+        Returns:
+            Dict[str, Any]: Property values keyed as in email_data
+        """
+        values = None
+        try:
+            values = tuple(mail_item.PropertyAccessor.GetProperties(_MAPI_SCHEMA_NAMES))
+            if len(values) != len(_MAPI_PROPERTIES):
+                values = None
+        except Exception as e:
+            self.logger.debug("Bulk property fetch failed, using object model: %s", e)
+        
+        if values is None:
+            try:
+                return {
+                    key: (self._local_to_utc(value) if key in _LOCAL_TIME_KEYS else value)
+                    if value is not None else default
+                    for (key, _, _, default), value in zip(_MAPI_PROPERTIES, _OBJECT_MODEL_GETTER(mail_item))
+                }
+            except Exception as e:
+                self.logger.debug("Object model property fetch failed, reading one at a time: %s", e)
+        
+        properties = {}
+        for i, (key, _, property_name, default) in enumerate(_MAPI_PROPERTIES):
+            value = values[i] if values is not None else None
+            if value is None or self._is_mapi_error(value):
+                try:
+                    value = getattr(mail_item, property_name)
+                    if key in _LOCAL_TIME_KEYS:
+                        value = self._local_to_utc(value)
+                except Exception as e:
+                    self.logger.debug("Failed to get property %s: %s", property_name, e)
+                    value = default
+            elif key == 'unread':
+                value = not (value & _MSGFLAG_READ)
+            elif key in ('email_thread_id', 'message_id'):
+                value = bytes(value).hex().upper()
+            elif key == 'categories':
+                value = ', '.join(value)
+            properties[key] = value if value is not None else default
+        
+        return properties
+    
+    @staticmethod
+    def _local_to_utc(value: Any) -> Any:
+        """
+        Convert an object model time to UTC, matching the MAPI property values.
+        
+        Outlook object model times hold local wall-clock time (pywin32 may
+        label them UTC regardless), so the label is dropped and the value
+        is read as local time. Values that are not datetimes are returned
+        unchanged.
+        
+        Args:
+            value: ReceivedTime or SentOn value
+            
+        Returns:
+            Any: Timezone-aware UTC datetime, or value unchanged
+        """
+        if not isinstance(value, datetime):
+            return value
+        return value.replace(tzinfo=None).astimezone(timezone.utc)
+    
+    @staticmethod
+    def _is_mapi_error(value: Any) -> bool:
+        """Check whether a GetProperties slot holds an HRESULT error code."""
+        # None of the fetched properties can be negative, while failure
+        # HRESULTs such as MAPI_E_NOT_FOUND are negative as signed 32-bit ints
+        return isinstance(value, int) and not isinstance(value, bool) and value < 0
+    
     def _safe_get_property(self, mail_item: Any, property_name: str, default: Any = None) -> Any:
         """
         Safely get a property from a mail item.
@@ -114,28 +280,34 @@ class EmailProcessor:
         try:
             return getattr(mail_item, property_name, default)
         except Exception as e:
-            self.logger.debug(f"Failed to get property {property_name}: {e}")
+            self.logger.debug("Failed to get property %s: %s", property_name, e)
             return default
     
-    def _extract_sender_email(self, mail_item: Any) -> str:
+    def _extract_sender_email(self, mail_item: Any, sender_email: Optional[str] = None) -> str:
         """
         Extract sender email address from mail item.
         
         Args:
             mail_item: Outlook mail item object
+            sender_email: Already fetched sender address, if available
             
         Returns:
             str: Sender email address
         """
         try:
-            # Try different methods to get sender email
-            sender_email = self._safe_get_property(mail_item, 'SenderEmailAddress', '')
-            
-            if not sender_email or sender_email.startswith('/'):
-                # Try to get from Sender object
-                sender = self._safe_get_property(mail_item, 'Sender')
-                if sender:
-                    sender_email = self._safe_get_property(sender, 'Address', '')
+            # Try different methods to get sender email, stopping at the
+            # first SMTP address
+            if sender_email is None:
+                sender_email = self._safe_get_property(mail_item, 'SenderEmailAddress', '')
+            if sender_email and _VALID_SMTP(sender_email):
+                return sender_email
+            
+            # Try to get from Sender object
+            sender = self._safe_get_property(mail_item, 'Sender')
+            if sender:
+                sender_email = self._safe_get_property(sender, 'Address', '')
+                if sender_email and _VALID_SMTP(sender_email):
+                    return sender_email
             
             if not sender_email or sender_email.startswith('/'):
                 # Try to extract from Reply Recipients
@@ -146,7 +318,7 @@ class EmailProcessor:
             return sender_email if sender_email and not sender_email.startswith('/') else ''
             
         except Exception as e:
-            self.logger.debug(f"Failed to extract sender email: {e}")
+            self.logger.debug("Failed to extract sender email: %s", e)
             return ''
     
     def _convert_outlook_time(self, outlook_time: Any) -> Optional[datetime]:
@@ -163,48 +335,45 @@ class EmailProcessor:
             if outlook_time is None:
                 return None
             
-            # Outlook times are typically in local timezone
+            # Times are UTC by the time they get here (see _local_to_utc)
             if hasattr(outlook_time, 'strftime'):
                 return outlook_time.replace(tzinfo=timezone.utc)
             
             return datetime.fromisoformat(str(outlook_time)).replace(tzinfo=timezone.utc)
             
         except Exception as e:
-            self.logger.debug(f"Failed to convert time: {e}")
+            self.logger.debug("Failed to convert time: %s", e)
             return None
     
-    def _extract_recipients(self, mail_item: Any, recipient_type: str) -> str:
+    def _extract_recipients(self, mail_item: Any) -> Tuple[str, str, str]:
         """
-        Extract recipients of specified type.
+        Extract To, CC and BCC recipients in a single pass over Recipients.
         
         Args:
             mail_item: Outlook mail item object
-            recipient_type: Type of recipients ('To', 'CC', 'BCC')
             
         Returns:
-            str: Semicolon-separated list of recipient emails
+            Tuple[str, str, str]: Semicolon-separated To, CC and BCC recipients
         """
+        # Keyed by OlMailRecipientType (olTo, olCC, olBCC)
+        buckets = {1: [], 2: [], 3: []}
         try:
-            recipients = []
-            recipient_collection = self._safe_get_property(mail_item, f'{recipient_type}Recipients')
+            recipient_collection = self._safe_get_property(mail_item, 'Recipients')
             
             if recipient_collection:
-                for i in range(1, recipient_collection.Count + 1):
-                    recipient = recipient_collection.Item(i)
+                for recipient in recipient_collection:
                     email = self._safe_get_property(recipient, 'Address', '')
+                    if not email:
+                        continue
                     name = self._safe_get_property(recipient, 'Name', '')
-                    
-                    if email:
-                        if name and name != email:
-                            recipients.append(f"{name} <{email}>")
-                        else:
-                            recipients.append(email)
-            
-            return '; '.join(recipients)
+                    bucket = buckets.get(self._safe_get_property(recipient, 'Type', 1))
+                    if bucket is not None:
+                        bucket.append(f"{name} <{email}>" if name and name != email else email)
             
         except Exception as e:
-            self.logger.debug(f"Failed to extract {recipient_type} recipients: {e}")
-            return ''
+            self.logger.debug("Failed to extract recipients: %s", e)
+        
+        return '; '.join(buckets[1]), '; '.join(buckets[2]), '; '.join(buckets[3])
     
     def _process_attachments(self, mail_item: Any) -> Dict[str, Any]:
         """
@@ -225,109 +394,69 @@ class EmailProcessor:
         
         try:
             attachments = self._safe_get_property(mail_item, 'Attachments')
-            if attachments and attachments.Count > 0:
+            # Count is a COM call, so read it once
+            count = attachments.Count if attachments else 0
+            if count > 0:
                 attachment_info['has_attachments'] = True
-                attachment_info['attachment_count'] = attachments.Count
-                
-                names = []
-                sizes = []
+                attachment_info['attachment_count'] = count
                 
-                for i in range(1, attachments.Count + 1):
-                    attachment = attachments.Item(i)
-                    name = self._safe_get_property(attachment, 'FileName', f'Attachment_{i}')
-                    size = self._safe_get_property(attachment, 'Size', 0)
-                    
-                    names.append(name)
-                    sizes.append(str(size))
+                # Enumerate the collection in one pass rather than calling
+                # Item(i) for each attachment
+                details = [
+                    (self._safe_get_property(attachment, 'FileName', f'Attachment_{i}'),
+                     self._safe_get_property(attachment, 'Size', 0))
+                    for i, attachment in enumerate(attachments, 1)
+                ]
                 
-                attachment_info['attachment_names'] = '; '.join(names)
-                attachment_info['attachment_sizes'] = '; '.join(sizes)
+                attachment_info['attachment_names'] = '; '.join(name for name, _ in details)
+                attachment_info['attachment_sizes'] = '; '.join(str(size) for _, size in details)
             
             return attachment_info
             
         except Exception as e:
-            self.logger.debug(f"Failed to process attachments: {e}")
+            self.logger.debug("Failed to process attachments: %s", e)
             return attachment_info
     
-    def _extract_categories(self, mail_item: Any) -> str:
-        """
-        Extract email categories.
-        
-        Args:
-            mail_item: Outlook mail item object
-            
-        Returns:
-            str: Semicolon-separated list of categories
-        """
-        try:
-            categories = self._safe_get_property(mail_item, 'Categories', '')
-            return categories if categories else ''
-        except Exception as e:
-            self.logger.debug(f"Failed to extract categories: {e}")
-            return ''
-    
-    def _check_reply_status(self, mail_item: Any) -> bool:
+    def _check_reply_status(self, mail_item: Any, subject_is_reply: bool) -> bool:
         """
         Check if email has been replied to.
         
         Args:
             mail_item: Outlook mail item object
+            subject_is_reply: Whether the subject carries a reply prefix
             
         Returns:
             bool: True if email has been replied to
         """
+        # The subject prefix is already known, so only go to COM without it
+        if subject_is_reply:
+            return True
+        
         try:
             # Check various reply indicators
             reply_recipients = self._safe_get_property(mail_item, 'ReplyRecipients')
-            if reply_recipients and reply_recipients.Count > 0:
-                return True
-            
-            # Check subject for "RE:" prefix
-            subject = self._safe_get_property(mail_item, 'Subject', '')
-            return subject.upper().startswith('RE:')
+            return bool(reply_recipients and reply_recipients.Count > 0)
             
         except Exception as e:
-            self.logger.debug(f"Failed to check reply status: {e}")
+            self.logger.debug("Failed to check reply status: %s", e)
             return False
     
-    def _check_forward_status(self, mail_item: Any) -> bool:
+    def _classify_subject(self, subject: str) -> Tuple[bool, bool]:
         """
-        Check if email has been forwarded.
+        Classify a subject line by its reply/forward prefix.
         
         Args:
-            mail_item: Outlook mail item object
+            subject: Email subject
             
         Returns:
-            bool: True if email has been forwarded
+            Tuple[bool, bool]: (is_reply, is_forward)
         """
-        try:
-            # Check subject for "FW:" or "FWD:" prefix
-            subject = self._safe_get_property(mail_item, 'Subject', '')
-            subject_upper = subject.upper()
-            return subject_upper.startswith('FW:') or subject_upper.startswith('FWD:')
-            
-        except Exception as e:
-            self.logger.debug(f"Failed to check forward status: {e}")
-            return False
+        # Only the first few characters can hold a prefix, so avoid
+        # lowercasing the whole subject
+        head = (subject or '')[:5].lower()
+        return head.startswith(_REPLY_PREFIXES), head.startswith(_FORWARD_PREFIXES)
     
-    def _get_priority_text(self, importance: int) -> str:
-        """
-        Convert importance number to text.
-        
-        Args:
-            importance: Outlook importance value
-            
-        Returns:
-            str: Priority as text
-        """
-        priority_map = {
-            0: 'Low',
-            1: 'Normal',
-            2: 'High'
-        }
-        return priority_map.get(importance, 'Normal')
-    
-    def _create_error_record(self, folder_name: str, error_message: str) -> Dict[str, Any]:
+    def _create_error_record(self, folder_name: str, error_message: str) -> ProcessedEmailRecord:
         """
         Create an error record for failed email processing.
         
@@ -336,28 +465,12 @@ class EmailProcessor:
             error_message: Error message
             
         Returns:
-            Dict[str, Any]: Error record
+            ProcessedEmailRecord: Error record
         """
-        return {
-            'folder_name': folder_name,
-            'subject': f'ERROR: {error_message}',
-            'sender_email': '',
-            'sender_name': '',
-            'received_time': None,
-            'sent_time': None,
-            'body_text': '',
-            'body_html': '',
-            'importance': 1,
-            'size': 0,
-            'unread': False,
-            'has_attachments': False,
-            'attachment_count': 0,
-            'categories': '',
-            'message_class': 'ERROR',
-            'conversation_topic': '',
-            'to_recipients': '',
-            'cc_recipients': '',
-            'bcc_recipients': '',
-            'error': True,
-            'error_message': error_message
-        }
+        return ProcessedEmailRecord(
+            folder_name=folder_name,
+            subject=f'ERROR: {error_message}',
+            message_class='ERROR',
+            error=True,
+            error_message=error_message,
+        )
@@ -0,0 +1,105 @@
+"""
+Email Record for Outlook2AI
+
+Defines the fixed-field records returned for each extracted and each
+processed email.
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional
+
+@dataclass(slots=True)
+class EmailRecord:
+    """One extracted email, with the fields of an OutlookConnector email batch."""
+
+    folder_name: str
+    subject: str
+    sender_email: str
+    sender_name: str
+    received_time: Any
+    sent_time: Any
+    body_text: str
+    body_html: str
+    importance: int
+    size: int
+    unread: bool
+    has_attachments: bool
+    attachment_count: int
+    categories: str
+    message_class: str
+    conversation_topic: str
+    to_recipients: str
+    cc_recipients: str
+    bcc_recipients: str
+    body_word_count: int
+    subject_length: int
+    is_reply: bool
+    is_forward: bool
+    domain: str
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, List[Any]]) -> List['EmailRecord']:
+        """
+        Build records from a batch of email columns.
+
+        Args:
+            columns: Email data, one list per field
+
+        Returns:
+            List[EmailRecord]: One record per row of the batch
+        """
+        return list(map(cls, *(columns[name] for name in EMAIL_RECORD_FIELDS)))
+
+# Field names in declaration order, matching the email batch columns
+EMAIL_RECORD_FIELDS = tuple(field.name for field in fields(EmailRecord))
+
+@dataclass(slots=True)
+class ProcessedEmailRecord:
+    """One email processed by EmailProcessor; the defaults form an error record."""
+
+    folder_name: str
+    subject: str = ''
+    sender_email: str = ''
+    sender_name: str = ''
+    received_time: Any = None
+    sent_time: Any = None
+    body_text: str = ''
+    body_html: Optional[str] = ''
+    cleaned_text: str = ''
+    cleaned_html: str = ''
+    email_addresses: List[str] = field(default_factory=list)
+    phone_numbers: List[str] = field(default_factory=list)
+    urls: List[str] = field(default_factory=list)
+    statistics: Dict[str, Any] = field(default_factory=dict)
+    keywords: List[str] = field(default_factory=list)
+    llm_optimized_text: str = ''
+    importance: int = 1
+    size: int = 0
+    unread: bool = False
+    message_class: str = ''
+    conversation_topic: str = ''
+    to_recipients: str = ''
+    cc_recipients: str = ''
+    bcc_recipients: str = ''
+    has_attachments: bool = False
+    attachment_count: int = 0
+    attachment_names: str = ''
+    attachment_sizes: str = ''
+    categories: str = ''
+    email_thread_id: str = ''
+    message_id: str = ''
+    is_forwarded: bool = False
+    is_replied: bool = False
+    priority: str = 'Normal'
+    error: bool = False
+    error_message: str = ''
+
+    def __getitem__(self, key: str) -> Any:
+        """Read a field by name, as with the email dictionaries this replaces."""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+# Field names in declaration order
+PROCESSED_EMAIL_FIELDS = tuple(field.name for field in fields(ProcessedEmailRecord))
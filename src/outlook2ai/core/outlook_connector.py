@@ -5,26 +5,92 @@ This module provides direct integration with MS Outlook desktop application
 using COM interface to extract emails from selected folders.
 """
 
-import win32com.client
-import pythoncom
+try:
+    import win32com.client
+    import pythoncom
+except ImportError:
+    # pywin32 only exists on Windows; connect() reports it missing
+    win32com = None
+    pythoncom = None
 from datetime import datetime, timezone
 import logging
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterator, Mapping, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress, repeat
 import time
+import sys
+from types import MappingProxyType
+from outlook2ai.core.email_record import EmailRecord
+from outlook2ai.utils.email_cache import EmailCache
+
+# PR_SENDER_SMTP_ADDRESS_W: the sender's SMTP address, set even when
+# SenderEmailAddress holds an Exchange X500 DN
+_PR_SENDER_SMTP_ADDRESS = 'http://schemas.microsoft.com/mapi/proptag/0x5D01001F'
+
+# PR_MESSAGE_DELIVERY_TIME, PR_CLIENT_SUBMIT_TIME and PR_LAST_MODIFICATION_TIME.
+# Read by proptag, Table time columns are UTC; the ReceivedTime, SentOn and
+# LastModificationTime names return local wall-clock time instead
+_PR_MESSAGE_DELIVERY_TIME = 'http://schemas.microsoft.com/mapi/proptag/0x0E060040'
+_PR_CLIENT_SUBMIT_TIME = 'http://schemas.microsoft.com/mapi/proptag/0x00390040'
+_PR_LAST_MODIFICATION_TIME = 'http://schemas.microsoft.com/mapi/proptag/0x30080040'
+
+# Scalar MailItem properties read straight from the folder Table, so each
+# email costs one row fetch instead of a COM call per property
+_TABLE_COLUMNS = (
+    'EntryID', 'Subject', 'SenderName', 'SenderEmailAddress',
+    _PR_MESSAGE_DELIVERY_TIME, _PR_CLIENT_SUBMIT_TIME, 'Importance', 'Size',
+    'UnRead', 'Categories', 'MessageClass', 'ConversationTopic',
+    _PR_LAST_MODIFICATION_TIME, 'To', 'CC', 'BCC', _PR_SENDER_SMTP_ADDRESS
+)
+
+# Outlook OlDefaultFolders values, built once and shared read-only
+_DEFAULT_FOLDERS = MappingProxyType({
+    'deleted_items': 3,
+    'outbox': 4,
+    'sent_items': 5,
+    'inbox': 6,
+    'drafts': 16,
+    'junk_email': 23,
+})
+
+# Emails opened and held in memory at a time when iterating a folder
+_BATCH_SIZE = 1000
+
+# Table filter matching olMail items (IPM.Note and its subclasses)
+_MAIL_ITEM_FILTER = '@SQL="http://schemas.microsoft.com/mapi/proptag/0x001A001F" LIKE \'IPM.Note%\''
+
+def _unzip(items: List[tuple], width: int) -> List[list]:
+    """Transpose equal-length tuples into width lists (empty lists for no items)."""
+    if not items:
+        return [[] for _ in range(width)]
+    return [list(column) for column in zip(*items)]
 
 class OutlookConnector:
     """Connects to MS Outlook desktop application and extracts email data."""
     
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, max_workers: int = 4, cache_path: Optional[str] = None,
+                 resolve_recipient_addresses: bool = False, batch_size: int = _BATCH_SIZE):
         """
         Initialize Outlook connector.
         
         Args:
             timeout: Connection timeout in seconds
+            max_workers: Threads used to open mail items when extracting content
+            cache_path: SQLite file caching extracted emails by EntryID (None to disable)
+            resolve_recipient_addresses: Enumerate each item's Recipients for
+                their addresses instead of using the To/CC/BCC display strings
+            batch_size: Emails read per Table.GetArray call and held in memory at a time
         """
         self.timeout = timeout
+        self.max_workers = max_workers
+        self.cache_path = cache_path
+        self.resolve_recipient_addresses = resolve_recipient_addresses
+        self.batch_size = batch_size
+        self.cache = None
         self.outlook_app = None
         self.namespace = None
+        self._folders = None
+        self._folder_index = {}
         self.logger = logging.getLogger(__name__)
         
     def connect(self) -> bool:
@@ -37,6 +103,9 @@ class OutlookConnector:
         try:
             self.logger.info("Connecting to MS Outlook desktop application...")
             
+            if win32com is None:
+                raise Exception("pywin32 is not installed; the Outlook COM interface needs Windows")
+            
             # Initialize COM
             pythoncom.CoInitialize()
             
@@ -45,8 +114,12 @@ class OutlookConnector:
             self.namespace = self.outlook_app.GetNamespace("MAPI")
             
             # Test connection by accessing default inbox
-            inbox = self.namespace.GetDefaultFolder(6)  # olFolderInbox = 6
-            self.logger.info(f"Connected successfully. Inbox contains {inbox.Items.Count} items")
+            inbox = self.namespace.GetDefaultFolder(_DEFAULT_FOLDERS['inbox'])
+            self._folders = None
+            self._folder_index = {}
+            if self.cache_path and self.cache is None:
+                self.cache = EmailCache(self.cache_path)
+            self.logger.info("Connected successfully. Default inbox: %s", inbox.Name)
             
             return True
             
@@ -57,19 +130,41 @@ class OutlookConnector:
     def disconnect(self):
         """Disconnect from Outlook and cleanup COM resources."""
         try:
+            self._folders = None
+            self._folder_index = {}
+            if self.cache:
+                self.cache.close()
+                self.cache = None
             if self.namespace:
                 self.namespace = None
             if self.outlook_app:
                 self.outlook_app = None
-            pythoncom.CoUninitialize()
+            if pythoncom is not None:
+                pythoncom.CoUninitialize()
             self.logger.info("Disconnected from Outlook")
         except Exception as e:
-            self.logger.warning(f"Error during disconnect: {str(e)}")
+            self.logger.warning("Error during disconnect: %s", e)
+    
+    def get_default_folder_constants(self) -> Mapping[str, int]:
+        """
+        Get the Outlook default folder constants by name.
+        
+        Returns:
+            Mapping[str, int]: Read-only map of folder name to OlDefaultFolders value
+        """
+        return _DEFAULT_FOLDERS
     
-    def get_folder_list(self) -> List[Dict[str, Any]]:
+    def get_folder_list(self, include_item_counts: bool = True, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Get list of available folders in Outlook.
         
+        The folder tree is walked once per connection and cached; item counts
+        are only fetched when requested.
+        
+        Args:
+            include_item_counts: Add each folder's item count (one COM call per folder)
+            refresh: Walk the folder tree again instead of using the cache
+            
         Returns:
             List[Dict]: List of folder information
         """
@@ -78,49 +173,118 @@ class OutlookConnector:
             if not self.namespace:
                 raise Exception("Not connected to Outlook")
             
-            # Get all mail folders
-            for store in self.namespace.Stores:
-                root_folder = store.GetRootFolder()
-                self._enumerate_folders(root_folder, folders, "")
+            if self._folders is None or refresh:
+                self._folders = self._enumerate_folders()
+                self._index_folders(self._folders)
+            
+            folders = [dict(folder) for folder in self._folders]
+            if include_item_counts:
+                for folder in folders:
+                    folder['item_count'] = self.get_folder_item_count(folder['folder_object'])
                 
         except Exception as e:
             self.logger.error(f"Error getting folder list: {str(e)}")
             
         return folders
     
-    def _enumerate_folders(self, folder, folder_list: List[Dict], path: str):
-        """Recursively enumerate all folders."""
+    def get_folder_item_count(self, folder) -> int:
+        """Get the number of items in a folder from its Table."""
         try:
-            current_path = f"{path}/{folder.Name}" if path else folder.Name
-            
-            # Add folder if it contains mail items
-            if folder.DefaultItemType == 0:  # olMailItem = 0
-                folder_list.append({
-                    'name': folder.Name,
-                    'path': current_path,
-                    'item_count': folder.Items.Count,
-                    'folder_object': folder
-                })
-            
-            # Recursively process subfolders
-            for subfolder in folder.Folders:
-                self._enumerate_folders(subfolder, folder_list, current_path)
-                
+            return folder.GetTable().GetRowCount()
         except Exception as e:
-            self.logger.warning(f"Error accessing folder {folder.Name}: {str(e)}")
+            self.logger.warning("Error counting items in folder %s: %s", folder.Name, e)
+            return 0
+    
+    def _enumerate_folders(self) -> List[Dict[str, Any]]:
+        """Walk the folders of every store, collecting the mail folders."""
+        folder_list = []
+        for store in self.namespace.Stores:
+            store_id = store.StoreID
+            stack = [(store.GetRootFolder(), "")]
+            while stack:
+                folder, path = stack.pop()
+                try:
+                    name = folder.Name
+                    current_path = f"{path}/{name}" if path else name
+                    
+                    # Add folder if it contains mail items
+                    if folder.DefaultItemType == 0:  # olMailItem = 0
+                        folder_list.append({
+                            'name': name,
+                            'path': current_path,
+                            'entry_id': folder.EntryID,
+                            'store_id': store_id,
+                            'folder_object': folder
+                        })
+                    
+                    # Push subfolders in reverse so they are visited in order
+                    subfolders = list(folder.Folders)
+                    stack.extend((subfolder, current_path) for subfolder in reversed(subfolders))
+                    
+                except Exception as e:
+                    self.logger.warning("Error accessing folder %s: %s", path, e)
+        
+        return folder_list
     
-    def extract_emails_from_folder(self, folder_path: str, max_emails: Optional[int] = None) -> List[Dict[str, Any]]:
+    def extract_emails_from_folder(self, folder_path: str, max_emails: Optional[int] = None,
+                                   include_content: bool = True) -> List[EmailRecord]:
         """
         Extract emails from specified folder.
         
+        Scalar properties are read in bulk through the folder's Table; the
+        full mail item is only opened when its content is needed.
+        
         Args:
             folder_path: Path to the folder (e.g., "Inbox/Subfolder")
             max_emails: Maximum number of emails to extract (None for all)
+            include_content: Open each item to read body, recipients and attachments
             
         Returns:
-            List[Dict]: List of email data
+            List[EmailRecord]: List of email data
+        """
+        emails = list(self.iter_emails_from_folder(folder_path, max_emails, include_content))
+        
+        self.logger.info("Successfully extracted %d emails from %s", len(emails), folder_path)
+        return emails
+    
+    def iter_emails_from_folder(self, folder_path: str, max_emails: Optional[int] = None,
+                                include_content: bool = True) -> Iterator[EmailRecord]:
+        """
+        Extract emails from specified folder, yielding one record at a time.
+        
+        Records are built one batch at a time, so a consumer that handles
+        and drops each email only holds a single batch in memory.
+        
+        Args:
+            folder_path: Path to the folder (e.g., "Inbox/Subfolder")
+            max_emails: Maximum number of emails to extract (None for all)
+            include_content: Open each item to read body, recipients and attachments
+            
+        Yields:
+            EmailRecord: Email data for the next email
+        """
+        for columns in self.iter_email_batches(folder_path, max_emails, include_content):
+            yield from EmailRecord.from_columns(columns)
+    
+    def iter_email_batches(self, folder_path: str, max_emails: Optional[int] = None,
+                           include_content: bool = True,
+                           batch_size: Optional[int] = None) -> Iterator[Dict[str, List[Any]]]:
+        """
+        Extract emails from specified folder, yielding them in batches.
+        
+        Only one batch of rows and mail items is held at a time, so callers
+        that write each batch out keep memory bounded on large folders. Each
+        batch is columnar, ready to hand to DataFrameManager or Arrow.
+        
+        Args:
+            folder_path: Path to the folder (e.g., "Inbox/Subfolder")
+            max_emails: Maximum number of emails to extract (None for all)
+            include_content: Open each item to read body, recipients and attachments
+            batch_size: Maximum number of emails per batch (None for the connector's batch_size)
+            
+        Yields:
+            Dict[str, List]: Email data for the next batch, one list per column
         """
-        emails = []
         try:
             if not self.namespace:
                 raise Exception("Not connected to Outlook")
@@ -130,54 +294,264 @@ class OutlookConnector:
             if not folder:
                 raise Exception(f"Folder not found: {folder_path}")
             
-            self.logger.info(f"Extracting emails from folder: {folder_path} ({folder.Items.Count} items)")
+            # Build a Table of mail items with only the columns we need
+            table = folder.GetTable(_MAIL_ITEM_FILTER)
+            table.Columns.RemoveAll()
+            for column in _TABLE_COLUMNS:
+                table.Columns.Add(column)
+            table.Sort("[ReceivedTime]", True)  # Sort by received time, descending
+            store_id = folder.StoreID
             
-            # Get all items from folder
-            items = folder.Items
-            items.Sort("[ReceivedTime]", True)  # Sort by received time, descending
+            # GetRowCount is a COM call, so only make it when the message is logged
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Extracting emails from folder: %s (%d items)", folder_path, table.GetRowCount())
             
-            count = 0
-            for item in items:
-                try:
-                    # Only process mail items
-                    if item.Class == 43:  # olMail = 43
-                        email_data = self._extract_email_data(item, folder_path)
-                        emails.append(email_data)
-                        count += 1
-                        
-                        if max_emails and count >= max_emails:
-                            break
-                            
-                except Exception as e:
-                    self.logger.warning(f"Error processing email: {str(e)}")
-                    continue
-            
-            self.logger.info(f"Successfully extracted {len(emails)} emails from {folder_path}")
+            batch_size = batch_size or self.batch_size
+            rows_read = 0
+            while not table.EndOfTable and not (max_emails and rows_read >= max_emails):
+                limit = min(batch_size, max_emails - rows_read) if max_emails else batch_size
+                
+                # Read the batch's scalar rows in one GetArray call; this is
+                # cheap compared with opening items
+                values = table.GetArray(limit)
+                if not values:
+                    break
+                rows_read += len(values)
+                
+                yield self._build_email_columns(values, folder_path, store_id, include_content)
             
         except Exception as e:
             self.logger.error(f"Error extracting emails from folder {folder_path}: {str(e)}")
+    
+    def _build_email_columns(self, values, folder_path: str, store_id: str,
+                             include_content: bool) -> Dict[str, List[Any]]:
+        """
+        Build email data columns for a block of Table rows.
+        
+        Table values are transposed straight into one list per column rather
+        than a dict per email. Items that could not be opened are dropped
+        from every column.
+        
+        Args:
+            values: Row values from Table.GetArray, ordered as _TABLE_COLUMNS
+            folder_path: Path of the folder the rows belong to
+            store_id: StoreID of the folder's store
+            include_content: Open each item to read body, recipients and attachments
             
-        return emails
+        Returns:
+            Dict[str, List]: Email data, one list per column
+        """
+        table_columns = dict(zip(_TABLE_COLUMNS, map(list, zip(*values))))
+        senders = [
+            smtp_address or sender or ''
+            for smtp_address, sender in zip(table_columns.pop(_PR_SENDER_SMTP_ADDRESS),
+                                            table_columns['SenderEmailAddress'])
+        ]
+        
+        if include_content:
+            keys = list(zip(table_columns['EntryID'], senders))
+            if self.cache:
+                content = self._hydrate_cached(keys, table_columns[_PR_LAST_MODIFICATION_TIME], folder_path, store_id)
+            else:
+                content = self._hydrate(keys, store_id)
+            
+            opened = [item is not None for item in content]
+            if not all(opened):
+                table_columns = {name: list(compress(column, opened)) for name, column in table_columns.items()}
+                content = list(compress(content, opened))
+            body_text, body_html, attachment_counts, senders, recipients = _unzip(content, 5)
+        else:
+            count = len(senders)
+            body_text, body_html, attachment_counts = [''] * count, [''] * count, [0] * count
+        
+        if include_content and self.resolve_recipient_addresses:
+            to_recipients, cc_recipients, bcc_recipients = _unzip(recipients, 3)
+        else:
+            # Display names as Outlook stores them (PR_DISPLAY_TO/CC/BCC)
+            to_recipients = [value or '' for value in table_columns['To']]
+            cc_recipients = [value or '' for value in table_columns['CC']]
+            bcc_recipients = [value or '' for value in table_columns['BCC']]
+        
+        columns = {
+            'folder_name': [folder_path] * len(senders),
+            'subject': [value or '' for value in table_columns['Subject']],
+            # Senders repeat across a mailbox, so keep one string per address
+            'sender_email': list(map(sys.intern, senders)),
+            'sender_name': [sys.intern(value) if value else '' for value in table_columns['SenderName']],
+            # Raw COM times (UTC); DataFrameManager converts the whole column at once
+            'received_time': table_columns[_PR_MESSAGE_DELIVERY_TIME],
+            'sent_time': table_columns[_PR_CLIENT_SUBMIT_TIME],
+            'body_text': body_text,
+            'body_html': body_html,
+            'importance': table_columns['Importance'],
+            'size': table_columns['Size'],
+            'unread': table_columns['UnRead'],
+            'has_attachments': [count > 0 for count in attachment_counts],
+            'attachment_count': attachment_counts,
+            'categories': [value or '' for value in table_columns['Categories']],
+            'message_class': [value or '' for value in table_columns['MessageClass']],
+            'conversation_topic': [value or '' for value in table_columns['ConversationTopic']],
+            'to_recipients': to_recipients,
+            'cc_recipients': cc_recipients,
+            'bcc_recipients': bcc_recipients,
+        }
+        
+        # Time-derived LLM fields are added by DataFrameManager
+        self._add_analysis_fields(columns)
+        return columns
+    
+    def _hydrate(self, keys: List[Tuple[str, str]], store_id: str) -> List[Optional[tuple]]:
+        """
+        Open the mail items behind Table rows and read their content.
+        
+        Rows are split into contiguous batches handled by worker threads so
+        COM round trips overlap with Python-side processing. Small folders
+        are handled on the calling thread.
+        
+        Args:
+            keys: (EntryID, Table sender address) per row, in output order
+            store_id: StoreID of the folder's store
+            
+        Returns:
+            List[Optional[tuple]]: _read_content results, in the same order
+            as keys (None where the item could not be opened)
+        """
+        if self.max_workers <= 1 or len(keys) < 2 * self.max_workers:
+            return self._hydrate_batch(keys, store_id, self.namespace)
+        
+        batch_size = -(-len(keys) // self.max_workers)
+        batches = [keys[i:i + batch_size] for i in range(0, len(keys), batch_size)]
+        
+        with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+            results = executor.map(self._hydrate_batch_in_thread, batches, repeat(store_id))
+            return [content for batch in results for content in batch]
+    
+    def _hydrate_cached(self, keys: List[Tuple[str, str]], modified_times: List[Any],
+                        folder_path: str, store_id: str) -> List[Optional[tuple]]:
+        """
+        Read item content, reusing cached content for items unchanged since it was stored.
+        
+        Only cache misses are opened; their content is written back to the
+        cache in one transaction.
+        
+        Args:
+            keys: (EntryID, Table sender address) per row, in output order
+            modified_times: PR_LAST_MODIFICATION_TIME per row
+            folder_path: Path of the folder the rows belong to
+            store_id: StoreID of the folder's store
+            
+        Returns:
+            List[Optional[tuple]]: _read_content results, in the same order
+            as keys (None where the item could not be opened)
+        """
+        content = [None] * len(keys)
+        stamps = [self._modification_stamp(modified) for modified in modified_times]
+        misses = []
+        for i, ((entry_id, _), stamp) in enumerate(zip(keys, stamps)):
+            cached = self.cache.get(entry_id, stamp) if stamp is not None else None
+            if not self._is_usable_content(cached):
+                misses.append(i)
+            else:
+                content[i] = cached
+        
+        self.logger.debug("Email cache: %d hits, %d misses in %s", len(keys) - len(misses), len(misses), folder_path)
+        
+        fetched = self._hydrate([keys[i] for i in misses], store_id)
+        for i, item in zip(misses, fetched):
+            content[i] = item
+        
+        self.cache.put_many(
+            (keys[i][0], stamps[i], item)
+            for i, item in zip(misses, fetched)
+            if item is not None and stamps[i] is not None
+        )
+        return content
+    
+    def _is_usable_content(self, content: Optional[tuple]) -> bool:
+        """
+        Check whether cached content can stand in for opening the item.
+        
+        Content is stored as read under the settings of the run that cached
+        it, so entries of another shape, or without recipients when they are
+        now resolved, are treated as misses and read again.
+        
+        Args:
+            content: Cached _read_content result, or None
+            
+        Returns:
+            bool: True if the content has every field this connector needs
+        """
+        if not isinstance(content, tuple) or len(content) != 5:
+            return False
+        return content[4] is not None or not self.resolve_recipient_addresses
+    
+    def _modification_stamp(self, modified) -> Optional[int]:
+        """Get a PR_LAST_MODIFICATION_TIME value as epoch seconds, if known."""
+        modified = self._convert_outlook_time(modified)
+        return int(modified.timestamp()) if modified else None
+    
+    def _hydrate_batch_in_thread(self, keys: List[Tuple[str, str]], store_id: str) -> List[Optional[tuple]]:
+        """Hydrate a batch of rows on a worker thread with its own COM apartment."""
+        pythoncom.CoInitialize()
+        try:
+            # COM proxies cannot cross apartments, so each worker gets its own
+            namespace = win32com.client.Dispatch("Outlook.Application").GetNamespace("MAPI")
+            content = self._hydrate_batch(keys, store_id, namespace)
+            namespace = None
+            return content
+        finally:
+            pythoncom.CoUninitialize()
+    
+    def _hydrate_batch(self, keys: List[Tuple[str, str]], store_id: str, namespace) -> List[Optional[tuple]]:
+        """Open each row's mail item through namespace and read its content."""
+        content = []
+        for entry_id, sender_email in keys:
+            try:
+                mail_item = namespace.GetItemFromID(entry_id, store_id)
+                content.append(self._read_content(mail_item, sender_email))
+            except Exception as e:
+                self.logger.warning("Error processing email: %s", e)
+                content.append(None)
+        return content
+    
+    def _index_folders(self, folders: List[Dict[str, Any]]):
+        """Rebuild the path lookup index from a folder walk."""
+        default_store_id = self.namespace.DefaultStore.StoreID
+        # Lookup paths are relative to the default store's root folder
+        self._folder_index = {
+            folder['path'].split('/', 1)[1].lower(): folder['folder_object']
+            for folder in folders
+            if folder['store_id'] == default_store_id and '/' in folder['path']
+        }
     
     def _find_folder_by_path(self, folder_path: str):
         """Find folder by path string."""
+        key = folder_path.lower()
+        folder = self._folder_index.get(key)
+        if folder is not None:
+            return folder
+        
         try:
-            path_parts = folder_path.split('/')
-            
-            # Start from default store
+            # Start from default store, resuming from the deepest known parent
             store = self.namespace.DefaultStore
             current_folder = store.GetRootFolder()
+            current_path = ""
             
-            for part in path_parts:
-                found = False
+            for part in key.split('/'):
+                current_path = f"{current_path}/{part}" if current_path else part
+                cached = self._folder_index.get(current_path)
+                if cached is not None:
+                    current_folder = cached
+                    continue
+                
                 for folder in current_folder.Folders:
-                    if folder.Name.lower() == part.lower():
+                    if folder.Name.lower() == part:
                         current_folder = folder
-                        found = True
                         break
-                
-                if not found:
+                else:
                     return None
+                
+                self._folder_index[current_path] = current_folder
             
             return current_folder
             
@@ -185,77 +559,87 @@ class OutlookConnector:
             self.logger.error(f"Error finding folder {folder_path}: {str(e)}")
             return None
     
-    def _extract_email_data(self, mail_item, folder_name: str) -> Dict[str, Any]:
-        """Extract data from a single email item."""
-        try:
-            # Basic email properties
-            email_data = {
-                'folder_name': folder_name,
-                'subject': getattr(mail_item, 'Subject', ''),
-                'sender_email': self._get_sender_email(mail_item),
-                'sender_name': getattr(mail_item, 'SenderName', ''),
-                'received_time': self._convert_outlook_time(getattr(mail_item, 'ReceivedTime', None)),
-                'sent_time': self._convert_outlook_time(getattr(mail_item, 'SentOn', None)),
-                'body_text': getattr(mail_item, 'Body', ''),
-                'body_html': getattr(mail_item, 'HTMLBody', ''),
-                'importance': getattr(mail_item, 'Importance', 1),
-                'size': getattr(mail_item, 'Size', 0),
-                'unread': getattr(mail_item, 'UnRead', False),
-                'has_attachments': getattr(mail_item, 'Attachments', None) and len(mail_item.Attachments) > 0,
-                'attachment_count': len(getattr(mail_item, 'Attachments', [])),
-                'categories': getattr(mail_item, 'Categories', ''),
-                'message_class': getattr(mail_item, 'MessageClass', ''),
-                'conversation_topic': getattr(mail_item, 'ConversationTopic', ''),
-                'to_recipients': self._get_recipients(mail_item, 'To'),
-                'cc_recipients': self._get_recipients(mail_item, 'CC'),
-                'bcc_recipients': self._get_recipients(mail_item, 'BCC'),
-            }
-            
-            # Additional LLM-useful fields
-            email_data.update({
-                'body_word_count': len(email_data['body_text'].split()) if email_data['body_text'] else 0,
-                'subject_length': len(email_data['subject']) if email_data['subject'] else 0,
-                'is_reply': 'RE:' in email_data['subject'].upper() if email_data['subject'] else False,
-                'is_forward': 'FW:' in email_data['subject'].upper() if email_data['subject'] else False,
-                'domain': email_data['sender_email'].split('@')[1] if '@' in email_data['sender_email'] else '',
-                'hour_received': email_data['received_time'].hour if email_data['received_time'] else None,
-                'day_of_week': email_data['received_time'].strftime('%A') if email_data['received_time'] else None,
-            })
-            
-            return email_data
+    def _read_content(self, mail_item, sender_email: str) -> tuple:
+        """
+        Read the fields only available from the full mail item.
+        
+        Args:
+            mail_item: Opened mail item
+            sender_email: Sender address from the Table, if any
             
-        except Exception as e:
-            self.logger.error(f"Error extracting email data: {str(e)}")
-            return {}
+        Returns:
+            tuple: (body_text, body_html, attachment_count, sender_email,
+            recipients), where recipients is a (to, cc, bcc) tuple when
+            resolve_recipient_addresses is set and None otherwise
+        """
+        attachment_count = len(getattr(mail_item, 'Attachments', []))
+        recipients = self._get_recipients(mail_item) if self.resolve_recipient_addresses else None
+        if not sender_email:
+            sender_email = self._get_sender_email(mail_item)
+        return (
+            getattr(mail_item, 'Body', ''),
+            getattr(mail_item, 'HTMLBody', ''),
+            attachment_count,
+            sender_email,
+            recipients,
+        )
+    
+    def _add_analysis_fields(self, columns: Dict[str, List[Any]]) -> None:
+        """
+        Add the text-derived LLM fields to a batch of email columns.
+        
+        Subject and sender checks run as NumPy string operations over the
+        whole batch rather than once per email.
+        
+        Args:
+            columns: Email data columns, updated in place
+        """
+        if not columns['subject']:
+            for field in ('body_word_count', 'subject_length', 'is_reply', 'is_forward', 'domain'):
+                columns[field] = []
+            return
+        
+        # Imported here so connecting and listing folders stay free of NumPy
+        import numpy as np
+        
+        subjects = np.array(columns['subject'], dtype=str)
+        upper_subjects = np.char.upper(subjects)
+        senders = np.array(columns['sender_email'], dtype=str)
+        # Text between the first and second '@', as str.split('@')[1] gives
+        domains = np.char.partition(np.char.partition(senders, '@')[..., 2], '@')[..., 0]
+        
+        columns['body_word_count'] = [len(body.split()) if body else 0 for body in columns['body_text']]
+        columns['subject_length'] = np.char.str_len(subjects).tolist()
+        columns['is_reply'] = (np.char.find(upper_subjects, 'RE:') >= 0).tolist()
+        columns['is_forward'] = (np.char.find(upper_subjects, 'FW:') >= 0).tolist()
+        columns['domain'] = domains.tolist()
     
     def _get_sender_email(self, mail_item) -> str:
-        """Extract sender email address."""
+        """Extract sender SMTP address with a single PropertyAccessor read."""
         try:
-            if hasattr(mail_item, 'SenderEmailAddress'):
-                return mail_item.SenderEmailAddress
-            elif hasattr(mail_item, 'Sender') and mail_item.Sender:
-                return mail_item.Sender.Address
-            return ''
+            return mail_item.PropertyAccessor.GetProperty(_PR_SENDER_SMTP_ADDRESS) or ''
         except:
-            return ''
+            return getattr(mail_item, 'SenderEmailAddress', '') or ''
     
-    def _get_recipients(self, mail_item, recipient_type: str) -> str:
-        """Extract recipients of specified type."""
+    def _get_recipients(self, mail_item) -> Tuple[str, str, str]:
+        """Extract To, CC and BCC recipients in one pass over Recipients."""
+        buckets = {1: [], 2: [], 3: []}  # olTo, olCC, olBCC
         try:
-            recipients = []
             if hasattr(mail_item, 'Recipients'):
                 for recipient in mail_item.Recipients:
-                    if recipient.Type == {'To': 1, 'CC': 2, 'BCC': 3}.get(recipient_type, 1):
-                        recipients.append(recipient.Address)
-            return '; '.join(recipients)
+                    bucket = buckets.get(recipient.Type)
+                    if bucket is not None:
+                        bucket.append(recipient.Address)
         except:
-            return ''
+            pass
+        return '; '.join(buckets[1]), '; '.join(buckets[2]), '; '.join(buckets[3])
     
     def _convert_outlook_time(self, outlook_time) -> Optional[datetime]:
         """Convert Outlook time to Python datetime."""
         try:
             if outlook_time:
-                # Outlook times are in local time, convert to UTC
+                # Table times are read by proptag, so they are already UTC;
+                # only naive values need the label
                 return outlook_time.replace(tzinfo=timezone.utc)
             return None
         except:
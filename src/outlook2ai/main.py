@@ -16,7 +16,6 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from outlook2ai.core.outlook_connector import OutlookConnector
-from outlook2ai.core.dataframe_manager import DataFrameManager
 from outlook2ai.utils.config_manager import ConfigManager
 from outlook2ai.utils.logger import setup_logging
 
@@ -36,11 +35,28 @@ class Outlook2AI:
         
         # Initialize components
         self.config = ConfigManager(config_path)
-        self.outlook_connector = OutlookConnector()
-        self.df_manager = DataFrameManager()
+        self.outlook_connector = OutlookConnector(
+            max_workers=self.config.get('outlook.max_workers', 4),
+            cache_path=self.config.get('outlook.cache_path'),
+            resolve_recipient_addresses=self.config.get('outlook.resolve_recipient_addresses', False),
+            batch_size=self.config.get('outlook.batch_size', 1000)
+        )
+        self._df_manager = None
         
         self.logger.info("Outlook2AI initialized successfully")
     
+    @property
+    def df_manager(self):
+        """DataFrame manager, created on first use so pandas is only imported when needed."""
+        if self._df_manager is None:
+            from outlook2ai.core.dataframe_manager import DataFrameManager
+            self._df_manager = DataFrameManager(
+                include_html_body=self.config.get('dataframe.include_html_body', False),
+                extract_entities=self.config.get('dataframe.extract_entities', False),
+                text_workers=self.config.get('dataframe.text_workers')
+            )
+        return self._df_manager
+    
     def connect_to_outlook(self) -> bool:
         """
         Connect to MS Outlook desktop application.
@@ -64,7 +80,7 @@ class Outlook2AI:
         """
         try:
             folders = self.outlook_connector.get_folder_list()
-            self.logger.info(f"Found {len(folders)} available folders")
+            self.logger.info("Found %d available folders", len(folders))
             return folders
         except Exception as e:
             self.logger.error(f"Error listing folders: {str(e)}")
@@ -82,25 +98,28 @@ class Outlook2AI:
             bool: True if extraction successful
         """
         try:
-            all_emails = []
+            all_columns = {}
+            total_emails = 0
             
             for folder_path in folder_paths:
-                self.logger.info(f"Extracting emails from folder: {folder_path}")
+                self.logger.info("Extracting emails from folder: %s", folder_path)
                 
-                emails = self.outlook_connector.extract_emails_from_folder(
-                    folder_path, max_emails_per_folder
-                )
+                folder_emails = 0
+                for columns in self.outlook_connector.iter_email_batches(folder_path, max_emails_per_folder):
+                    for key, values in columns.items():
+                        all_columns.setdefault(key, []).extend(values)
+                    folder_emails += len(columns['subject'])
                 
-                if emails:
-                    all_emails.extend(emails)
-                    self.logger.info(f"Extracted {len(emails)} emails from {folder_path}")
+                if folder_emails:
+                    total_emails += folder_emails
+                    self.logger.info("Extracted %d emails from %s", folder_emails, folder_path)
                 else:
-                    self.logger.warning(f"No emails extracted from {folder_path}")
+                    self.logger.warning("No emails extracted from %s", folder_path)
             
-            if all_emails:
+            if total_emails:
                 # Create DataFrame
-                self.df = self.df_manager.create_dataframe(all_emails)
-                self.logger.info(f"Created DataFrame with {len(self.df)} total emails")
+                self.df = self.df_manager.create_dataframe(all_columns)
+                self.logger.info("Created DataFrame with %d total emails", len(self.df))
                 return True
             else:
                 self.logger.error("No emails were extracted from any folder")
@@ -110,6 +129,39 @@ class Outlook2AI:
             self.logger.error(f"Error during email extraction: {str(e)}")
             return False
     
+    def stream_emails(self, folder_paths: List[str], output_path: str,
+                      max_emails_per_folder: Optional[int] = None, format_type: str = 'arrow') -> bool:
+        """
+        Extract emails from specified folders straight to an Arrow IPC or Parquet file.
+        
+        Emails are written batch by batch as they are extracted and no
+        DataFrame is built, keeping memory bounded for very large mailboxes.
+        
+        Args:
+            folder_paths: List of folder paths to extract from
+            output_path: Path of the file to write
+            max_emails_per_folder: Maximum emails per folder (None for all)
+            format_type: Stream format ('arrow' or 'parquet')
+            
+        Returns:
+            bool: True if any emails were written
+        """
+        try:
+            batches = (
+                batch
+                for folder_path in folder_paths
+                for batch in self.outlook_connector.iter_email_batches(folder_path, max_emails_per_folder)
+            )
+            if self.df_manager.write_email_stream(batches, output_path, format_type):
+                return True
+            
+            self.logger.error("No emails were extracted from any folder")
+            return False
+            
+        except Exception as e:
+            self.logger.error(f"Error during email streaming: {str(e)}")
+            return False
+    
     def get_dataframe(self):
         """Get the current email DataFrame."""
         return getattr(self, 'df', None)
@@ -186,6 +238,9 @@ def main():
                        help="Output file path")
     parser.add_argument("--format", choices=['csv', 'json', 'parquet'], default='csv',
                        help="Output format")
+    parser.add_argument("--stream", action='store_true',
+                       help="Write raw emails to --output in batches without building a DataFrame, "
+                            "as Parquet with --format parquet and as an Arrow IPC file otherwise")
     parser.add_argument("--list-folders", action='store_true',
                        help="List available folders and exit")
     parser.add_argument("--config", help="Path to configuration file")
@@ -212,6 +267,16 @@ def main():
                 print("-" * 30)
             return 0
         
+        # Stream emails straight to disk if requested
+        if args.stream:
+            print(f"Streaming emails from folders: {args.folders}")
+            stream_format = 'parquet' if args.format == 'parquet' else 'arrow'
+            if not app.stream_emails(args.folders, args.output, args.max_emails, stream_format):
+                print("ERROR: Failed to stream emails")
+                return 1
+            print(f"Data streamed successfully to: {args.output}")
+            return 0
+        
         # Extract emails
         print(f"Extracting emails from folders: {args.folders}")
         if not app.extract_emails(args.folders, args.max_emails):
@@ -4,10 +4,22 @@ Processors module for Outlook2AI.
 This module contains text processing and content analysis components.
 """
 
-try:
-    from .text_processor import TextProcessor
-    
-    __all__ = ['TextProcessor']
-except ImportError:
-    # Handle import errors gracefully
-    __all__ = []
+import importlib
+
+# Processor classes, loaded from their submodules on first use
+_LAZY_IMPORTS = {
+    'TextProcessor': '.text_processor',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+def __getattr__(name):
+    """Import an exported class from its submodule on first access."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -7,12 +7,144 @@ email content for LLM analysis.
 
 import re
 import html
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 try:
     from bs4 import BeautifulSoup
 except ImportError:
     BeautifulSoup = None
-from typing import Dict, List, Optional, Tuple, Any
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+try:
+    import re2
+except ImportError:
+    re2 = None
+from typing import Dict, List, Optional, Tuple, Any, Callable, Union
 import logging
+import pandas as pd
+
+# Patterns compiled once and shared by every email processed
+# '<' ends a tag too, so a run of unclosed tags is scanned once rather than
+# to the end of the document from each of them
+_TAG_RE = re.compile(r'<[^<>]+>')
+# Markup that never holds visible text: the head, script and style blocks and
+# comments (where Outlook keeps its VML and Office XML). Openers and closers
+# are matched separately, see _strip_non_text
+_NON_TEXT_OPEN_RE = re.compile(r'<(?:(head|script|style)\b|!--)', re.IGNORECASE)
+_NON_TEXT_CLOSE_RES = {
+    'head': re.compile(r'</head\s*>', re.IGNORECASE),
+    'script': re.compile(r'</script\s*>', re.IGNORECASE),
+    'style': re.compile(r'</style\s*>', re.IGNORECASE),
+    None: re.compile(r'-->'),
+}
+_WS_RE = re.compile(r'\s+')
+_SPECIAL_CHAR_RE = re.compile(r'[^\w\s\.\,\!\?\;\:\-\(\)\[\]\"\'@]')
+# stdlib re retries every word boundary of a long run of address characters
+# with no '@' (base64 blobs, long tokens), going quadratic; RE2 finds the same
+# matches in linear time, treating only ASCII characters as word characters
+_EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'
+_EMAIL_RE = re2.compile(_EMAIL_PATTERN) if re2 else re.compile(_EMAIL_PATTERN)
+# XXX-XXX-XXXX / XXX.XXX.XXXX, (XXX) XXX-XXXX and XXX XXX XXXX in one pass
+_PHONE_RE = re.compile(
+    r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
+    r'|\b\(\d{3}\)\s?\d{3}[-.]?\d{4}\b'
+    r'|\b\d{3}\s\d{3}\s\d{4}\b'
+)
+# Only ASCII classes and no word boundaries, so RE2 matches exactly as re does
+_URL_PATTERN = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
+_URL_RE = re2.compile(_URL_PATTERN) if re2 else re.compile(_URL_PATTERN)
+_WORD_RE = re.compile(r'\b\w+\b')
+# One match per non-blank run of text between sentence terminators
+_SENT_RE = re.compile(r'[^\s.!?][^.!?]*')
+
+# Characters of body text kept for LLM analysis
+_LLM_TEXT_LIMIT = 10000
+# Raw HTML read per character of text wanted, leaving room for markup
+_HTML_SLACK = 4
+# Distinct bodies whose analysis is kept, so a message seen in several
+# folders (or a repeated notification) is only processed once. Entries are
+# keyed by a digest of the body, and the cached text is capped in total
+_BODY_CACHE_SIZE = 1024
+_BODY_CACHE_CHARS = 8 * 1024 * 1024
+
+# Common words never reported as keywords
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
+    'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
+    'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those', 'i',
+    'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us',
+    'them', 'my', 'your', 'his', 'her', 'its', 'our', 'their', 'am'
+})
+
+# Entity patterns scanned together, in the order extract_entities returns them
+_ENTITY_PATTERNS = (_EMAIL_RE, _PHONE_RE, _URL_RE)
+
+def _compile_entity_database():
+    """Compile the entity patterns into one Hyperscan database, if available."""
+    if hyperscan is None:
+        return None
+    try:
+        database = hyperscan.Database()
+        # Hyperscan's \b is ASCII-only; without it each expression matches
+        # wherever the re pattern can, so the scan never misses an entity type
+        database.compile(
+            expressions=[pattern.pattern.replace(r'\b', '').encode('ascii') for pattern in _ENTITY_PATTERNS],
+            ids=list(range(len(_ENTITY_PATTERNS))),
+            elements=len(_ENTITY_PATTERNS),
+        )
+        return database
+    except Exception as e:
+        logging.getLogger(__name__).warning("Hyperscan unavailable, using re for entity extraction: %s", e)
+        return None
+
+_HS_DB = _compile_entity_database()
+
+def _strip_non_text(html_content: str, limit: Optional[int] = None) -> str:
+    """
+    Remove head, script and style blocks and comments from HTML.
+    
+    A block runs from its opener to the first close tag after it; a block
+    with no close tag is left in place. Each close tag is searched for
+    forward from its opener, and one found to be missing is not searched
+    for again, so the scan stays linear in the document even with many
+    unclosed tags (a single lazy <x>.*?</x> pattern rescans the rest of
+    the document for each of them).
+    
+    Args:
+        html_content: Raw HTML content
+        limit: Stop once this many characters have been kept (None for
+            the whole document)
+        
+    Returns:
+        str: HTML without its non-text markup
+    """
+    pieces = []
+    kept = 0
+    kept_from = search_from = 0
+    unclosed = set()
+    while limit is None or kept < limit:
+        opener = _NON_TEXT_OPEN_RE.search(html_content, search_from)
+        if opener is None:
+            break
+        name = opener.group(1).lower() if opener.group(1) else None
+        closer = None if name in unclosed else _NON_TEXT_CLOSE_RES[name].search(html_content, opener.end())
+        if closer is None:
+            unclosed.add(name)
+            search_from = opener.end()
+            continue
+        pieces.append(html_content[kept_from:opener.start()])
+        kept += opener.start() - kept_from
+        kept_from = search_from = closer.end()
+    pieces.append(html_content[kept_from:])
+    return ''.join(pieces)
 
 class TextProcessor:
     """Handles text processing and cleaning for email content."""
@@ -20,13 +152,20 @@ class TextProcessor:
     def __init__(self):
         """Initialize text processor."""
         self.logger = logging.getLogger(__name__)
+        # Body digest -> (analysis, characters of text it holds), oldest first
+        self._body_cache = OrderedDict()
+        self._body_cache_chars = 0
+        self._body_cache_lock = threading.Lock()
         
-    def clean_html_content(self, html_content: str) -> str:
+    def clean_html_content(self, html_content: str, max_chars: Optional[int] = None) -> str:
         """
         Clean HTML content and extract plain text.
         
         Args:
             html_content: Raw HTML content from email
+            max_chars: Only parse the start of the document's text-bearing
+                markup and return at most this many characters (None for
+                the whole document)
             
         Returns:
             str: Cleaned plain text content
@@ -34,41 +173,53 @@ class TextProcessor:
         if not html_content:
             return ""
         
+        if max_chars is not None:
+            # Outlook HTML can open with tens of KB of styles, so drop the
+            # markup without text before cutting the document short
+            html_content = _strip_non_text(html_content, max_chars * _HTML_SLACK)[:max_chars * _HTML_SLACK]
+        
         try:
-            if BeautifulSoup is None:
+            if LexborHTMLParser is not None:
+                # Parse with lexbor's C parser, removing script and style elements
+                tree = LexborHTMLParser(html_content)
+                tree.strip_tags(['script', 'style'])
+                text = tree.root.text() if tree.root is not None else ''
+            elif BeautifulSoup is not None:
+                # Parse HTML content
+                soup = BeautifulSoup(html_content, 'html.parser')
+                
+                # Remove script and style elements
+                for script in soup(["script", "style"]):
+                    script.decompose()
+                
+                # Get text content
+                text = soup.get_text()
+            else:
                 # Fallback: simple HTML tag removal
-                text = re.sub(r'<[^>]+>', '', html_content)
+                text = _TAG_RE.sub('', html_content)
                 text = html.unescape(text)
-                text = re.sub(r'\s+', ' ', text).strip()
-                return text
-                
-            # Parse HTML content
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # Get text content
-            text = soup.get_text()
+                text = _WS_RE.sub(' ', text).strip()
+                return text[:max_chars] if max_chars is not None else text
             
             # Clean up whitespace
             lines = (line.strip() for line in text.splitlines())
             chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
             text = ' '.join(chunk for chunk in chunks if chunk)
             
-            return text
+            return text[:max_chars] if max_chars is not None else text
             
         except Exception as e:
             self.logger.error(f"Error cleaning HTML content: {e}")
             return html_content
     
-    def clean_plain_text(self, text_content: str) -> str:
+    def clean_plain_text(self, text_content: str, max_chars: Optional[int] = None) -> str:
         """
         Clean plain text content.
         
         Args:
             text_content: Raw plain text content
+            max_chars: Only clean the start of the text and return at most
+                this many characters (None for the whole text)
             
         Returns:
             str: Cleaned text content
@@ -76,20 +227,24 @@ class TextProcessor:
         if not text_content:
             return ""
         
+        if max_chars is not None:
+            # Cleaning only shrinks text; the slack covers collapsed whitespace
+            text_content = text_content[:max_chars * 2]
+        
         try:
             # Decode HTML entities
             text = html.unescape(text_content)
             
             # Remove excessive whitespace
-            text = re.sub(r'\s+', ' ', text)
+            text = _WS_RE.sub(' ', text)
             
             # Remove special characters but keep basic punctuation
-            text = re.sub(r'[^\w\s\.\,\!\?\;\:\-\(\)\[\]\"\'@]', '', text)
+            text = _SPECIAL_CHAR_RE.sub('', text)
             
             # Strip leading/trailing whitespace
             text = text.strip()
             
-            return text
+            return text[:max_chars] if max_chars is not None else text
             
         except Exception as e:
             self.logger.error(f"Error cleaning plain text: {e}")
@@ -108,9 +263,8 @@ class TextProcessor:
         if not text:
             return []
         
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        return list(set(emails))  # Remove duplicates
+        # Remove duplicates, keeping the order found
+        return list(dict.fromkeys(_EMAIL_RE.findall(text)))
     
     def extract_phone_numbers(self, text: str) -> List[str]:
         """
@@ -125,19 +279,8 @@ class TextProcessor:
         if not text:
             return []
         
-        # Common phone number patterns
-        patterns = [
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # XXX-XXX-XXXX or XXX.XXX.XXXX
-            r'\b\(\d{3}\)\s?\d{3}[-.]?\d{4}\b',  # (XXX) XXX-XXXX
-            r'\b\d{3}\s\d{3}\s\d{4}\b',  # XXX XXX XXXX
-        ]
-        
-        phone_numbers = []
-        for pattern in patterns:
-            phones = re.findall(pattern, text)
-            phone_numbers.extend(phones)
-        
-        return list(set(phone_numbers))  # Remove duplicates
+        # Remove duplicates, keeping the order found
+        return list(dict.fromkeys(_PHONE_RE.findall(text)))
     
     def extract_urls(self, text: str) -> List[str]:
         """
@@ -152,9 +295,51 @@ class TextProcessor:
         if not text:
             return []
         
-        url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        urls = re.findall(url_pattern, text)
-        return list(set(urls))  # Remove duplicates
+        # Remove duplicates, keeping the order found
+        return list(dict.fromkeys(_URL_RE.findall(text)))
+    
+    def extract_entities(self, text: str) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Extract email addresses, phone numbers and URLs from text.
+        
+        With Hyperscan installed, one scan of the text finds which of the
+        three entity types occur and re only searches for those; most bodies
+        contain no phone numbers or URLs, so those searches are skipped.
+        Without Hyperscan each type is searched with re.
+        
+        Args:
+            text: Text content to search
+            
+        Returns:
+            Tuple[List[str], List[str], List[str]]: Email addresses, phone
+            numbers and URLs found
+        """
+        if not text:
+            return [], [], []
+        
+        extractors = (self.extract_email_addresses, self.extract_phone_numbers, self.extract_urls)
+        if _HS_DB is None:
+            return tuple(extract(text) for extract in extractors)
+        
+        found = set()
+        
+        def on_match(pattern_id, start, end, flags, context):
+            found.add(pattern_id)
+            # Stop once every entity type has been seen
+            return len(found) == len(_ENTITY_PATTERNS)
+        
+        try:
+            _HS_DB.scan(text.encode('utf-8', 'surrogatepass'), match_event_handler=on_match)
+        except hyperscan.ScanTerminated:
+            pass
+        except Exception as e:
+            self.logger.debug("Hyperscan scan failed, using re: %s", e)
+            found = set(range(len(_ENTITY_PATTERNS)))
+        
+        return tuple(
+            extract(text) if pattern_id in found else []
+            for pattern_id, extract in enumerate(extractors)
+        )
     
     def get_text_statistics(self, text: str) -> Dict[str, int]:
         """
@@ -182,8 +367,7 @@ class TextProcessor:
         word_count = len(words)
         
         # Sentence count (approximate)
-        sentences = re.split(r'[.!?]+', text)
-        sentence_count = len([s for s in sentences if s.strip()])
+        sentence_count = len(_SENT_RE.findall(text))
         
         # Paragraph count (approximate)
         paragraphs = text.split('\n\n')
@@ -210,63 +394,189 @@ class TextProcessor:
         if not text:
             return []
         
-        # Convert to lowercase and split into words
-        words = re.findall(r'\b\w+\b', text.lower())
-        
-        # Filter out common stop words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
-            'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
-            'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those', 'i',
-            'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us',
-            'them', 'my', 'your', 'his', 'her', 'its', 'our', 'their', 'am'
-        }
-        
-        # Filter words
-        keywords = [
-            word for word in words 
-            if len(word) >= min_length and word not in stop_words
-        ]
-        
-        # Count frequency and return most common
-        from collections import Counter
-        word_freq = Counter(keywords)
+        # Count the lowercased words, skipping short and stop words, in one pass
+        word_freq = Counter(
+            word for word in _WORD_RE.findall(text.lower())
+            if len(word) >= min_length and word not in _STOP_WORDS
+        )
         
         # Return words that appear more than once, sorted by frequency
         return [word for word, count in word_freq.most_common(50) if count > 1]
     
-    def process_email_body(self, html_body: str, text_body: str) -> Dict[str, Any]:
+    def clean_html_series(self, html_series: pd.Series) -> pd.Series:
+        """
+        Clean a column of HTML bodies into plain text in bulk.
+        
+        Non-text markup is dropped as in clean_html_content, then tags are
+        stripped with vectorized pandas string operations rather than
+        parsing each document.
+        
+        Args:
+            html_series: Raw HTML bodies, missing values allowed
+            
+        Returns:
+            pd.Series: Cleaned plain text, '' where there was no HTML
+        """
+        text = (
+            html_series.fillna('').astype(str)
+            .map(_strip_non_text)
+            .str.replace(_TAG_RE, ' ', regex=True)
+        )
+        # Only bodies containing entities need unescaping
+        has_entities = text.str.contains('&', regex=False)
+        if has_entities.any():
+            text = text.where(~has_entities, text[has_entities].map(html.unescape))
+        return text.str.replace(_WS_RE, ' ', regex=True).str.strip()
+    
+    def extract_email_addresses_series(self, text_series: pd.Series) -> pd.Series:
+        """
+        Extract the distinct email addresses in each text of a column.
+        
+        Args:
+            text_series: Text content to search, missing values allowed
+            
+        Returns:
+            pd.Series: List of found email addresses per row
+        """
+        return self._findall_series(text_series, _EMAIL_RE)
+    
+    def extract_phone_numbers_series(self, text_series: pd.Series) -> pd.Series:
+        """
+        Extract the distinct phone numbers in each text of a column.
+        
+        Args:
+            text_series: Text content to search, missing values allowed
+            
+        Returns:
+            pd.Series: List of found phone numbers per row
+        """
+        return self._findall_series(text_series, _PHONE_RE)
+    
+    def extract_urls_series(self, text_series: pd.Series) -> pd.Series:
+        """
+        Extract the distinct URLs in each text of a column.
+        
+        Args:
+            text_series: Text content to search, missing values allowed
+            
+        Returns:
+            pd.Series: List of found URLs per row
+        """
+        return self._findall_series(text_series, _URL_RE)
+    
+    @staticmethod
+    def _findall_series(text_series: pd.Series, pattern: Any) -> pd.Series:
+        """Find all matches of a compiled re or re2 pattern per row, without duplicates."""
+        matches = text_series.fillna('').astype(str).map(pattern.findall)
+        return matches.map(lambda found: list(dict.fromkeys(found)) if len(found) > 1 else found)
+    
+    def process_email_body(self, html_body: Union[str, Callable[[], str]],
+                           text_body: Union[str, Callable[[], str]]) -> Dict[str, Any]:
         """
         Process email body content and extract useful information.
         
+        Either body may be passed as a zero-argument callable so it is only
+        fetched when needed. The plain text body is preferred; the HTML body
+        is only fetched and cleaned when there is no usable plain text, and
+        then only as far as the first 10000 characters of text. Results are
+        cached by body content, so a body seen again is not reprocessed.
+        
         Args:
-            html_body: HTML version of email body
-            text_body: Plain text version of email body
+            html_body: HTML version of email body, or a callable returning it
+            text_body: Plain text version of email body, or a callable returning it
             
         Returns:
             Dict[str, Any]: Processed content and metadata
         """
-        result = {}
-        
-        # Clean the content
-        if html_body:
-            result['cleaned_html'] = self.clean_html_content(html_body)
-        else:
-            result['cleaned_html'] = ""
+        if callable(text_body):
+            text_body = text_body()
         
+        result = None
         if text_body:
-            result['cleaned_text'] = self.clean_plain_text(text_body)
+            result = self._analyze_body_cached(text_body, False)
+        
+        if result is None:
+            if callable(html_body):
+                html_body = html_body()
+            result = self._analyze_body_cached(html_body or '', True)
+        
+        # The analysis is cached and shared, so hand out copies of its lists
+        return {
+            key: value.copy() if isinstance(value, (list, dict)) else value
+            for key, value in result.items()
+        }
+    
+    def _analyze_body_cached(self, body: str, is_html: bool) -> Optional[Dict[str, Any]]:
+        """
+        Analyze one email body, reusing the analysis of an identical body.
+        
+        The cache is keyed by a 128-bit BLAKE2b digest of the body, so only
+        the derived results are kept rather than every body seen. It holds
+        at most _BODY_CACHE_SIZE analyses and _BODY_CACHE_CHARS characters
+        of cleaned text, evicting the least recently used first.
+        
+        Args:
+            body: Plain text or HTML body content
+            is_html: Whether body is the HTML version
+            
+        Returns:
+            Optional[Dict[str, Any]]: As returned by _analyze_body
+        """
+        key = hashlib.blake2b(
+            body.encode('utf-8', 'surrogatepass'), digest_size=16, person=b'html' if is_html else b'text'
+        ).digest()
+        with self._body_cache_lock:
+            entry = self._body_cache.get(key)
+            if entry is not None:
+                self._body_cache.move_to_end(key)
+                return entry[0]
+        
+        result = self._analyze_body(body, is_html)
+        chars = 0
+        if result is not None:
+            chars = len(result['cleaned_text']) + len(result['cleaned_html']) + len(result['llm_optimized_text'])
+        if chars > _BODY_CACHE_CHARS:
+            return result
+        
+        with self._body_cache_lock:
+            if key not in self._body_cache:
+                self._body_cache[key] = (result, chars)
+                self._body_cache_chars += chars
+                while len(self._body_cache) > _BODY_CACHE_SIZE or self._body_cache_chars > _BODY_CACHE_CHARS:
+                    _, (_, evicted_chars) = self._body_cache.popitem(last=False)
+                    self._body_cache_chars -= evicted_chars
+        return result
+    
+    def _analyze_body(self, body: str, is_html: bool) -> Optional[Dict[str, Any]]:
+        """
+        Clean and analyze one email body.
+        
+        Args:
+            body: Plain text or HTML body content
+            is_html: Whether body is the HTML version
+            
+        Returns:
+            Optional[Dict[str, Any]]: Processed content and metadata, or None
+            when a plain text body has no usable text
+        """
+        result = {'cleaned_text': "", 'cleaned_html': ""}
+        
+        # Clean the content
+        if is_html:
+            if body:
+                # Only the start of the document can reach the LLM text, so
+                # leave the rest of a long HTML body unparsed
+                result['cleaned_html'] = self.clean_html_content(body, max_chars=_LLM_TEXT_LIMIT)
         else:
-            result['cleaned_text'] = ""
+            result['cleaned_text'] = self.clean_plain_text(body)
+            if not result['cleaned_text']:
+                return None
         
         # Use the better version for analysis
         analysis_text = result['cleaned_text'] if result['cleaned_text'] else result['cleaned_html']
         
         # Extract entities
-        result['email_addresses'] = self.extract_email_addresses(analysis_text)
-        result['phone_numbers'] = self.extract_phone_numbers(analysis_text)
-        result['urls'] = self.extract_urls(analysis_text)
+        result['email_addresses'], result['phone_numbers'], result['urls'] = self.extract_entities(analysis_text)
         
         # Get statistics
         result['statistics'] = self.get_text_statistics(analysis_text)
@@ -275,6 +585,6 @@ class TextProcessor:
         result['keywords'] = self.extract_keywords(analysis_text)
         
         # Create final processed text for LLM analysis
-        result['llm_optimized_text'] = analysis_text[:10000]  # Limit for LLM context
+        result['llm_optimized_text'] = analysis_text[:_LLM_TEXT_LIMIT]  # Limit for LLM context
         
         return result
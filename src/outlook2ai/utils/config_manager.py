@@ -6,10 +6,14 @@ Manages application configuration and settings.
 
 import yaml
 import json
+import pickle
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
 
+# libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 class ConfigManager:
     """Manages application configuration."""
     
@@ -34,33 +38,73 @@ class ConfigManager:
             config_file = Path(self.config_path)
             
             if not config_file.exists():
-                self.logger.warning(f"Config file not found: {self.config_path}")
+                self.logger.warning("Config file not found: %s", self.config_path)
                 return self._get_default_config()
             
-            with open(config_file, 'r', encoding='utf-8') as f:
-                if config_file.suffix.lower() == '.yaml' or config_file.suffix.lower() == '.yml':
-                    config = yaml.safe_load(f)
-                else:
+            if config_file.suffix.lower() == '.yaml' or config_file.suffix.lower() == '.yml':
+                config = self._load_yaml_config(config_file)
+            else:
+                with open(config_file, 'r', encoding='utf-8') as f:
                     config = json.load(f)
             
-            self.logger.info(f"Configuration loaded from: {self.config_path}")
+            self.logger.info("Configuration loaded from: %s", self.config_path)
             return config
             
         except Exception as e:
             self.logger.error(f"Error loading config: {str(e)}")
             return self._get_default_config()
     
+    def _load_yaml_config(self, config_file: Path) -> Dict[str, Any]:
+        """
+        Load a YAML config, reusing the parsed copy pickled beside it.
+        
+        The pickle sidecar records the modification time and size of the
+        YAML it was parsed from and is only used while both still match.
+        
+        Args:
+            config_file: Path to the YAML configuration file
+            
+        Returns:
+            Dict[str, Any]: Parsed configuration
+        """
+        stat = config_file.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cache_file = config_file.with_name(config_file.name + '.pkl')
+        
+        try:
+            cached_stamp, config = pickle.loads(cache_file.read_bytes())
+            if cached_stamp == stamp:
+                return config
+        except Exception:
+            pass
+        
+        with open(config_file, 'r', encoding='utf-8') as f:
+            config = yaml.load(f, Loader=_YAML_LOADER)
+        
+        try:
+            cache_file.write_bytes(pickle.dumps((stamp, config), pickle.HIGHEST_PROTOCOL))
+        except Exception as e:
+            self.logger.debug("Could not write config cache %s: %s", cache_file, e)
+        
+        return config
+    
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration."""
         return {
             'outlook': {
                 'timeout': 30,
                 'default_folders': ['Inbox'],
-                'max_emails_per_folder': None
+                'max_emails_per_folder': None,
+                'max_workers': 4,
+                'cache_path': None,
+                'resolve_recipient_addresses': False,
+                'batch_size': 1000
             },
             'dataframe': {
                 'export_format': 'csv',
                 'include_html_body': False,
+                'extract_entities': False,
+                'text_workers': None,
                 'clean_text': True
             },
             'llm': {
@@ -100,7 +144,7 @@ class ConfigManager:
             with open(config_file, 'w', encoding='utf-8') as f:
                 yaml.dump(self.config, f, default_flow_style=False, indent=2)
             
-            self.logger.info(f"Configuration saved to: {save_path}")
+            self.logger.info("Configuration saved to: %s", save_path)
             return True
             
         except Exception as e:
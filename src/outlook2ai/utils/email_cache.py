@@ -0,0 +1,77 @@
+"""
+Email Cache for Outlook2AI
+
+Persists extracted email content keyed by EntryID so that re-runs over the same
+folders can skip opening mail items that have not changed.
+"""
+
+import pickle
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, Optional, Tuple
+import logging
+
+class EmailCache:
+    """SQLite-backed store of extracted email content keyed by EntryID."""
+
+    def __init__(self, cache_path: str):
+        """
+        Initialize email cache.
+
+        Args:
+            cache_path: Path to the SQLite cache file
+        """
+        self.logger = logging.getLogger(__name__)
+        self.cache_path = cache_path
+
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(cache_path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "entry_id TEXT PRIMARY KEY, last_modified INTEGER, payload BLOB)"
+        )
+        self.connection.commit()
+
+    def get(self, entry_id: str, last_modified: int) -> Optional[Any]:
+        """
+        Get cached email content if it is at least as new as last_modified.
+
+        Args:
+            entry_id: EntryID of the mail item
+            last_modified: Item's last modification time (epoch seconds)
+
+        Returns:
+            Optional[Any]: Cached email content, or None on a miss
+        """
+        try:
+            row = self.connection.execute(
+                "SELECT payload FROM cache WHERE entry_id = ? AND last_modified >= ?",
+                (entry_id, last_modified)
+            ).fetchone()
+            return pickle.loads(row[0]) if row else None
+        except Exception as e:
+            self.logger.debug("Cache lookup failed for %s: %s", entry_id, e)
+            return None
+
+    def put_many(self, entries: Iterable[Tuple[str, int, Any]]):
+        """
+        Store email content in a single transaction.
+
+        Args:
+            entries: (entry_id, last_modified, content) tuples
+        """
+        try:
+            with self.connection:
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO cache (entry_id, last_modified, payload) VALUES (?, ?, ?)",
+                    ((entry_id, last_modified, pickle.dumps(content, pickle.HIGHEST_PROTOCOL))
+                     for entry_id, last_modified, content in entries)
+                )
+        except Exception as e:
+            self.logger.warning("Error writing email cache: %s", e)
+
+    def close(self):
+        """Close the cache database."""
+        if self.connection:
+            self.connection.close()
+            self.connection = None
@@ -2,12 +2,17 @@
 Logging configuration for Outlook2AI
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 from pathlib import Path
 from datetime import datetime
 import sys
 
+# Background listener writing queued records to the console and log file
+_queue_listener = None
+
 def setup_logging(log_level: str = 'INFO', log_file: str = None) -> None:
     """
     Setup logging configuration.
@@ -29,12 +34,12 @@ def setup_logging(log_level: str = 'INFO', log_file: str = None) -> None:
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
     
-    # Setup root logger
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format=log_format,
-        datefmt=date_format,
-        handlers=[
+    # Setup root logger. Callers only pay for a queue put; a background
+    # listener formats the records and does the console and disk I/O.
+    global _queue_listener
+    if _queue_listener is None and not logging.getLogger().handlers:
+        formatter = logging.Formatter(log_format, datefmt=date_format)
+        handlers = [
             # Console handler
             logging.StreamHandler(sys.stdout),
             # File handler with rotation
@@ -45,11 +50,35 @@ def setup_logging(log_level: str = 'INFO', log_file: str = None) -> None:
                 encoding='utf-8'
             )
         ]
-    )
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(log_queue, *handlers)
+        _queue_listener.start()
+        atexit.register(stop_logging)
+        
+        # The listener's handlers apply the real format; the queue handler
+        # only merges the message arguments
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        logging.basicConfig(level=getattr(logging, log_level.upper()), handlers=[queue_handler])
+        
+        # Skip looking up thread and process details for every record
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
     
     # Set specific logger levels
     logging.getLogger('outlook2ai').setLevel(getattr(logging, log_level.upper()))
     
     # Suppress some verbose loggers
     logging.getLogger('urllib3').setLevel(logging.WARNING)
-    logging.getLogger('requests').setLevel(logging.WARNING)
\ No newline at end of file
+    logging.getLogger('requests').setLevel(logging.WARNING)
+
+def stop_logging() -> None:
+    """Write out any queued log records and stop the background listener."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
@@ -0,0 +1,27 @@
+"""
+Shared pytest configuration for the Outlook2AI tests.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the src layout importable once for the whole session
+SRC_DIR = str(Path(__file__).parent.parent / 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+def pytest_configure(config):
+    """Register the markers used by the test suite."""
+    config.addinivalue_line(
+        "markers", "serial: talks to the real Outlook COM server; never run alongside other such tests"
+    )
+
+def pytest_collection_modifyitems(config, items):
+    """Keep serial tests on one pytest-xdist worker under --dist loadgroup."""
+    if not config.pluginmanager.hasplugin('xdist'):
+        return
+    for item in items:
+        if item.get_closest_marker('serial'):
+            item.add_marker(pytest.mark.xdist_group('serial'))
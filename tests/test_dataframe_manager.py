@@ -0,0 +1,91 @@
+"""
+Test suite for dataframe_manager module.
+
+This module contains unit tests for the DataFrameManager class, covering
+computed fields and the streaming Arrow exports.
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from outlook2ai.core import dataframe_manager
+from outlook2ai.core.dataframe_manager import DataFrameManager
+
+
+def _email_batch(subjects, received_time):
+    """Build a batch of email columns as OutlookConnector.iter_email_batches yields them."""
+    count = len(subjects)
+    return {
+        'folder_name': ["Inbox"] * count,
+        'subject': list(subjects),
+        'sender_email': ["sender@example.com"] * count,
+        'received_time': [received_time] * count,
+        'importance': [1] * count,
+        'size': [1024] * count,
+        'unread': [False] * count,
+        'has_attachments': [False] * count,
+    }
+
+
+class TestDataFrameManager(unittest.TestCase):
+    """Test cases for DataFrameManager class."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.manager = DataFrameManager()
+    
+    def test_age_days_measured_in_utc(self):
+        """Test that email age is measured from the current UTC time."""
+        now = datetime.now(timezone.utc)
+        
+        df = self.manager.create_dataframe([
+            {'subject': "Recent", 'received_time': now - timedelta(hours=23)},
+            {'subject': "Older", 'received_time': now - timedelta(days=2, hours=1)},
+            {'subject': "Undated", 'received_time': None},
+        ])
+        
+        self.assertEqual(df['age_days'].iloc[0], 0)
+        self.assertEqual(df['age_days'].iloc[1], 2)
+        self.assertTrue(df['age_days'].isna().iloc[2])
+
+    
+    @unittest.skipIf(dataframe_manager.pa is None, "pyarrow not installed")
+    def test_write_email_stream_round_trip(self):
+        """Test that streamed batches read back with their schema and every row."""
+        pa = dataframe_manager.pa
+        received = datetime(2025, 5, 31, 10, 0, 0, tzinfo=timezone.utc)
+        batches = [
+            _email_batch(["First", "Second", "Third"], received),
+            _email_batch([], received),  # Empty batches are skipped
+            _email_batch(["Fourth", "Fifth"], received),
+        ]
+        readers = {
+            'arrow': lambda path: pa.ipc.open_file(path).read_all(),
+            'parquet': dataframe_manager.pq.read_table,
+        }
+        
+        for format_type, read in readers.items():
+            with self.subTest(format=format_type), tempfile.TemporaryDirectory() as output_dir:
+                output_path = os.path.join(output_dir, f"emails.{format_type}")
+                
+                written = self.manager.write_email_stream(iter(batches), output_path, format_type)
+                table = read(output_path)
+                
+                self.assertEqual(written, 5)
+                self.assertEqual(table.num_rows, 5)
+                self.assertTrue(table.schema.equals(self.manager._get_arrow_schema(batches[0])))
+                self.assertEqual(table.schema.field('received_time').type, pa.timestamp('us', tz='UTC'))
+                self.assertEqual(table.column('subject').to_pylist(),
+                                 ["First", "Second", "Third", "Fourth", "Fifth"])
+                self.assertEqual(table.column('received_time').to_pylist(), [received] * 5)
+    
+    @unittest.skipIf(dataframe_manager.pa is None, "pyarrow not installed")
+    def test_write_email_stream_unsupported_format(self):
+        """Test that an unknown stream format is rejected."""
+        with self.assertRaises(ValueError):
+            self.manager.write_email_stream([], "emails.csv", 'csv')
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -6,301 +6,332 @@ including tests for email item processing, metadata extraction, and error handli
 """
 
 import unittest
-from unittest.mock import Mock, MagicMock, patch
-from datetime import datetime
-import pandas as pd
-import sys
-import os
+from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from datetime import datetime, timezone
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import pytest
 
-from outlook2ai.core.email_processor import EmailProcessor
+from outlook2ai.core.email_processor import EmailProcessor, _MAPI_PROPERTIES
+
+# HRESULT GetProperties reports for a property the item does not have
+_MAPI_E_NOT_FOUND = -2147221233
+
+
+class _Collection(list):
+    """Stand-in for an Outlook collection (Recipients, Attachments)."""
+    
+    @property
+    def Count(self):
+        return len(self)
+
+
+class _ComErrorObject:
+    """Stand-in for a COM object whose every property read fails."""
+    
+    def __getattr__(self, name):
+        raise Exception(f"COM error reading {name}")
+
+
+def _build_mock_email():
+    """Build the mock Outlook email shared by the tests."""
+    # Create mock email item
+    mock_email = SimpleNamespace(
+        Subject="Test Subject",
+        Body="Test body content",
+        HTMLBody="<html><body>Test HTML content</body></html>",
+        ReceivedTime=datetime(2024, 1, 15, 10, 30, 0),
+        SentOn=datetime(2024, 1, 15, 10, 25, 0),
+        Size=1024,
+        UnRead=False,
+        Importance=2,  # High importance
+        SenderName="John Doe",
+        SenderEmailAddress="john.doe@example.com",
+        MessageClass="IPM.Note",
+        ConversationID="conversation123",
+        ConversationTopic="Test Conversation",
+        EntryID="entry123",
+        Categories="Category1; Category2",
+        To="Jane Smith",
+        CC="Bob Johnson",
+        BCC="",
+    )
+    
+    # Mock Recipients collection
+    mock_recipient1 = SimpleNamespace(
+        Name="Jane Smith",
+        Address="jane.smith@example.com",
+        Type=1,  # TO
+    )
+    
+    mock_recipient2 = SimpleNamespace(
+        Name="Bob Johnson",
+        Address="bob.johnson@example.com",
+        Type=2,  # CC
+    )
+    
+    mock_email.Recipients = _Collection([mock_recipient1, mock_recipient2])
+    
+    # Mock Attachments collection
+    mock_attachment = SimpleNamespace(
+        FileName="document.pdf",
+        Size=2048,
+        Type=1,  # File attachment
+    )
+    
+    mock_email.Attachments = _Collection([mock_attachment])
+    
+    return mock_email
+
+
+# Built once at import; the tests only read it
+_MOCK_EMAIL_TEMPLATE = _build_mock_email()
 
 
 class TestEmailProcessor(unittest.TestCase):
     """Test cases for EmailProcessor class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create the processor once; no test changes its state."""
+        cls.processor = EmailProcessor()
+    
     def setUp(self):
         """Set up test fixtures before each test method."""
-        self.processor = EmailProcessor()
-        
-        # Create mock email item
-        self.mock_email = Mock()
-        self.mock_email.Subject = "Test Subject"
-        self.mock_email.Body = "Test body content"
-        self.mock_email.HTMLBody = "<html><body>Test HTML content</body></html>"
-        self.mock_email.ReceivedTime = datetime(2024, 1, 15, 10, 30, 0)
-        self.mock_email.SentOn = datetime(2024, 1, 15, 10, 25, 0)
-        self.mock_email.Size = 1024
-        self.mock_email.UnRead = False
-        self.mock_email.Importance = 2  # Normal importance
-        self.mock_email.Sensitivity = 0  # Normal sensitivity
-        self.mock_email.SenderName = "John Doe"
-        self.mock_email.SenderEmailAddress = "john.doe@example.com"
-        self.mock_email.ConversationID = "conversation123"
-        self.mock_email.ConversationTopic = "Test Conversation"
-        self.mock_email.EntryID = "entry123"
-        self.mock_email.Categories = "Category1; Category2"
-        
-        # Mock Recipients collection
-        mock_recipient1 = Mock()
-        mock_recipient1.Name = "Jane Smith"
-        mock_recipient1.Address = "jane.smith@example.com"
-        mock_recipient1.Type = 1  # TO
-        
-        mock_recipient2 = Mock()
-        mock_recipient2.Name = "Bob Johnson"
-        mock_recipient2.Address = "bob.johnson@example.com"
-        mock_recipient2.Type = 2  # CC
-        
-        self.mock_email.Recipients = [mock_recipient1, mock_recipient2]
-        
-        # Mock Attachments collection
-        mock_attachment = Mock()
-        mock_attachment.FileName = "document.pdf"
-        mock_attachment.Size = 2048
-        mock_attachment.Type = 1  # File attachment
-        
-        self.mock_email.Attachments = [mock_attachment]
+        self.mock_email = _MOCK_EMAIL_TEMPLATE
     
     def test_process_email_item_success(self):
         """Test successful processing of an email item."""
-        result = self.processor.process_email_item(self.mock_email)
+        result = self.processor.process_email_item(self.mock_email, "Inbox")
         
         # Verify basic fields
+        self.assertFalse(result.error)
+        self.assertEqual(result.folder_name, "Inbox")
         self.assertEqual(result['subject'], "Test Subject")
-        self.assertEqual(result['body'], "Test body content")
-        self.assertEqual(result['html_body'], "<html><body>Test HTML content</body></html>")
+        self.assertEqual(result['body_text'], "Test body content")
         self.assertEqual(result['sender_name'], "John Doe")
         self.assertEqual(result['sender_email'], "john.doe@example.com")
         self.assertFalse(result['unread'])
         self.assertEqual(result['size'], 1024)
         self.assertEqual(result['importance'], 2)
-        self.assertEqual(result['sensitivity'], 0)
+        self.assertEqual(result['priority'], "High")
+        self.assertEqual(result['message_class'], "IPM.Note")
+        
+        # The plain text body is usable, so HTMLBody is never fetched
+        self.assertIsNone(result['body_html'])
+        self.assertEqual(result['cleaned_text'], "Test body content")
         
         # Verify datetime fields
-        self.assertEqual(result['received_time'], datetime(2024, 1, 15, 10, 30, 0))
-        self.assertEqual(result['sent_time'], datetime(2024, 1, 15, 10, 25, 0))
+        # Object model times are local and come back converted to UTC
+        self.assertEqual(result['received_time'], datetime(2024, 1, 15, 10, 30, 0).astimezone(timezone.utc))
+        self.assertEqual(result['sent_time'], datetime(2024, 1, 15, 10, 25, 0).astimezone(timezone.utc))
         
-        # Verify recipient processing
-        self.assertIn('jane.smith@example.com', result['to_recipients'])
-        self.assertIn('bob.johnson@example.com', result['cc_recipients'])
+        # Recipients default to the To/CC/BCC display strings
+        self.assertEqual(result['to_recipients'], "Jane Smith")
+        self.assertEqual(result['cc_recipients'], "Bob Johnson")
         
         # Verify attachment processing
+        self.assertTrue(result['has_attachments'])
         self.assertEqual(result['attachment_count'], 1)
-        self.assertIn('document.pdf', result['attachment_names'])
-        
-    def test_process_email_item_minimal_fields(self):
-        """Test processing email with minimal required fields."""
-        minimal_email = Mock()
-        minimal_email.Subject = "Minimal Subject"
-        minimal_email.Body = "Minimal body"
-        minimal_email.HTMLBody = ""
-        minimal_email.ReceivedTime = datetime.now()
-        minimal_email.SentOn = datetime.now()
-        minimal_email.Size = 100
-        minimal_email.UnRead = True
-        minimal_email.Importance = 1
-        minimal_email.Sensitivity = 0
-        minimal_email.SenderName = ""
-        minimal_email.SenderEmailAddress = ""
-        minimal_email.ConversationID = ""
-        minimal_email.ConversationTopic = ""
-        minimal_email.EntryID = ""
-        minimal_email.Categories = ""
-        minimal_email.Recipients = []
-        minimal_email.Attachments = []
+        self.assertEqual(result['attachment_names'], "document.pdf")
+        self.assertEqual(result['attachment_sizes'], "2048")
+    
+    def test_mapi_time_fallback_is_utc(self):
+        """Test that an object model time fallback matches the UTC MAPI times."""
+        mapi_values = {
+            'subject': "Test Subject",
+            'received_time': _MAPI_E_NOT_FOUND,  # Falls back to ReceivedTime
+            'sent_time': datetime(2024, 1, 15, 9, 25, 0, tzinfo=timezone.utc),
+            'importance': 1,
+            'size': 1024,
+            'unread': 1,
+        }
+        mail_item = SimpleNamespace(
+            ReceivedTime=datetime(2024, 1, 15, 10, 30, 0),  # Local wall-clock time
+            PropertyAccessor=SimpleNamespace(GetProperties=lambda names: [
+                mapi_values.get(key, _MAPI_E_NOT_FOUND) for key, _, _, _ in _MAPI_PROPERTIES
+            ]),
+        )
+        
+        properties = self.processor._get_mapi_properties(mail_item)
+        
+        self.assertEqual(properties['received_time'], datetime(2024, 1, 15, 10, 30, 0).astimezone(timezone.utc))
+        self.assertEqual(properties['sent_time'], datetime(2024, 1, 15, 9, 25, 0, tzinfo=timezone.utc))
+        self.assertEqual(properties['received_time'].utcoffset(), properties['sent_time'].utcoffset())
+        self.assertEqual(properties['subject'], "Test Subject")
+    
+    def test_local_to_utc_drops_pywin32_utc_label(self):
+        """Test that an object model time labelled UTC is still read as local time."""
+        labelled = datetime(2024, 1, 15, 10, 30, 0, tzinfo=timezone.utc)
+        
+        self.assertEqual(
+            EmailProcessor._local_to_utc(labelled),
+            datetime(2024, 1, 15, 10, 30, 0).astimezone(timezone.utc)
+        )
+        self.assertEqual(EmailProcessor._local_to_utc("Not a datetime"), "Not a datetime")
+    
+    def test_process_email_item_include_html_body(self):
+        """Test that HTMLBody is fetched when the processor is asked to keep it."""
+        processor = EmailProcessor(include_html_body=True)
         
-        result = self.processor.process_email_item(minimal_email)
+        result = processor.process_email_item(self.mock_email, "Inbox")
         
-        self.assertEqual(result['subject'], "Minimal Subject")
-        self.assertEqual(result['body'], "Minimal body")
-        self.assertEqual(result['attachment_count'], 0)
-        self.assertEqual(len(result['to_recipients']), 0)
-        self.assertEqual(len(result['cc_recipients']), 0)
-        self.assertEqual(len(result['bcc_recipients']), 0)
+        self.assertEqual(result.body_html, "<html><body>Test HTML content</body></html>")
     
-    def test_process_recipients_all_types(self):
-        """Test processing recipients of all types (TO, CC, BCC)."""
-        recipients = []
-        
-        # TO recipient
-        to_recipient = Mock()
-        to_recipient.Name = "To Person"
-        to_recipient.Address = "to@example.com"
-        to_recipient.Type = 1
-        recipients.append(to_recipient)
+    def test_process_email_item_resolved_recipients(self):
+        """Test that recipient addresses come from Recipients when resolving them."""
+        processor = EmailProcessor(resolve_recipient_addresses=True)
         
-        # CC recipient
-        cc_recipient = Mock()
-        cc_recipient.Name = "CC Person"
-        cc_recipient.Address = "cc@example.com"
-        cc_recipient.Type = 2
-        recipients.append(cc_recipient)
+        result = processor.process_email_item(self.mock_email, "Inbox")
         
-        # BCC recipient
-        bcc_recipient = Mock()
-        bcc_recipient.Name = "BCC Person"
-        bcc_recipient.Address = "bcc@example.com"
-        bcc_recipient.Type = 3
-        recipients.append(bcc_recipient)
+        self.assertEqual(result.to_recipients, "Jane Smith <jane.smith@example.com>")
+        self.assertEqual(result.cc_recipients, "Bob Johnson <bob.johnson@example.com>")
+        self.assertEqual(result.bcc_recipients, "")
         
-        to_list, cc_list, bcc_list = self.processor._process_recipients(recipients)
+    def test_process_email_item_minimal_fields(self):
+        """Test processing email with minimal required fields."""
+        minimal_email = SimpleNamespace(
+            Subject="Minimal Subject",
+            Body="Minimal body",
+            HTMLBody="",
+            ReceivedTime=datetime.now(),
+            SentOn=datetime.now(),
+            Size=100,
+            UnRead=True,
+            Importance=1,
+            SenderName="",
+            SenderEmailAddress="",
+            ConversationID="",
+            ConversationTopic="",
+            EntryID="",
+            Categories="",
+            Recipients=_Collection(),
+            Attachments=_Collection(),
+        )
+        
+        result = self.processor.process_email_item(minimal_email, "Inbox")
         
-        self.assertIn("to@example.com", to_list)
-        self.assertIn("cc@example.com", cc_list)
-        self.assertIn("bcc@example.com", bcc_list)
+        self.assertEqual(result['subject'], "Minimal Subject")
+        self.assertEqual(result['body_text'], "Minimal body")
+        self.assertEqual(result['attachment_count'], 0)
+        self.assertEqual(result['to_recipients'], "")
+        self.assertEqual(result['cc_recipients'], "")
+        self.assertEqual(result['bcc_recipients'], "")
     
-    def test_process_recipients_missing_address(self):
-        """Test processing recipients with missing email addresses."""
-        recipients = []
-        
-        # Recipient with missing address
-        recipient = Mock()
-        recipient.Name = "No Email Person"
-        recipient.Address = ""
-        recipient.Type = 1
-        recipients.append(recipient)
-        
-        to_list, cc_list, bcc_list = self.processor._process_recipients(recipients)
-        
-        # Should skip recipients without email addresses
-        self.assertEqual(len(to_list), 0)
+    def test_process_email_items_columns(self):
+        """Test processing a batch of emails into equal-length columns."""
+        columns = self.processor.process_email_items([self.mock_email] * 1000, 'Inbox')
+
+        self.assertTrue(columns)
+        for name, values in columns.items():
+            self.assertEqual(len(values), 1000, name)
+        self.assertEqual(set(columns['subject']), {"Test Subject"})
+        self.assertEqual(set(columns['folder_name']), {"Inbox"})
     
     def test_process_attachments_multiple_types(self):
         """Test processing different types of attachments."""
-        attachments = []
+        attachments = _Collection()
         
         # File attachment
-        file_attachment = Mock()
-        file_attachment.FileName = "document.docx"
-        file_attachment.Size = 1024
-        file_attachment.Type = 1
+        file_attachment = SimpleNamespace(
+            FileName="document.docx",
+            Size=1024,
+            Type=1,
+        )
         attachments.append(file_attachment)
         
         # Embedded message
-        embedded_msg = Mock()
-        embedded_msg.FileName = "FW: Message"
-        embedded_msg.Size = 2048
-        embedded_msg.Type = 5
+        embedded_msg = SimpleNamespace(
+            FileName="FW: Message",
+            Size=2048,
+            Type=5,
+        )
         attachments.append(embedded_msg)
         
-        count, names, total_size = self.processor._process_attachments(attachments)
+        info = self.processor._process_attachments(SimpleNamespace(Attachments=attachments))
         
-        self.assertEqual(count, 2)
-        self.assertIn("document.docx", names)
-        self.assertIn("FW: Message", names)
-        self.assertEqual(total_size, 3072)
-    
-    def test_safe_get_attribute_success(self):
-        """Test safe attribute getting with valid attribute."""
-        obj = Mock()
-        obj.test_attr = "test_value"
+        self.assertTrue(info['has_attachments'])
+        self.assertEqual(info['attachment_count'], 2)
+        self.assertEqual(info['attachment_names'], "document.docx; FW: Message")
+        self.assertEqual(info['attachment_sizes'], "1024; 2048")
+    
+    def test_safe_get_property_success(self):
+        """Test safe property getting with valid property."""
+        obj = SimpleNamespace(test_attr="test_value")
         
-        result = self.processor._safe_get_attribute(obj, 'test_attr', 'default')
+        result = self.processor._safe_get_property(obj, 'test_attr', 'default')
         self.assertEqual(result, "test_value")
     
-    def test_safe_get_attribute_missing(self):
-        """Test safe attribute getting with missing attribute."""
-        obj = Mock()
+    def test_safe_get_property_missing(self):
+        """Test safe property getting with missing property."""
+        obj = SimpleNamespace()
         
-        result = self.processor._safe_get_attribute(obj, 'missing_attr', 'default')
+        result = self.processor._safe_get_property(obj, 'missing_attr', 'default')
         self.assertEqual(result, "default")
     
-    def test_safe_get_attribute_exception(self):
-        """Test safe attribute getting when exception occurs."""
-        obj = Mock()
-        obj.test_attr = Mock(side_effect=Exception("Test error"))
-        
-        result = self.processor._safe_get_attribute(obj, 'test_attr', 'default')
+    def test_safe_get_property_exception(self):
+        """Test safe property getting when the COM read raises."""
+        result = self.processor._safe_get_property(_ComErrorObject(), 'test_attr', 'default')
         self.assertEqual(result, "default")
     
     def test_process_email_item_with_exception(self):
         """Test email processing when an exception occurs."""
-        # Create a mock that raises an exception for Subject
-        error_email = Mock()
-        error_email.Subject = Mock(side_effect=Exception("COM Error"))
-        
-        result = self.processor.process_email_item(error_email)
-        
-        # Should return None when critical error occurs
-        self.assertIsNone(result)
+        with patch.object(self.processor.text_processor, 'process_email_body',
+                          side_effect=Exception("COM Error")):
+            result = self.processor.process_email_item(self.mock_email, "Inbox")
+        
+        # Should return an error record rather than raise
+        self.assertTrue(result.error)
+        self.assertEqual(result.folder_name, "Inbox")
+        self.assertEqual(result.subject, "ERROR: COM Error")
+        self.assertEqual(result.message_class, "ERROR")
+        self.assertEqual(result.error_message, "COM Error")
     
     def test_process_email_item_com_error(self):
         """Test handling of COM errors during email processing."""
-        with patch('outlook2ai.core.email_processor.logger') as mock_logger:
-            # Mock email that raises COM error on property access
-            com_error_email = Mock()
-            com_error_email.Subject = Mock(side_effect=Exception("COM object error"))
-            
-            result = self.processor.process_email_item(com_error_email)
-            
-            # Should log error and return None
-            self.assertIsNone(result)
-            mock_logger.error.assert_called()
+        # Every property read fails, so each field falls back to its default
+        result = self.processor.process_email_item(_ComErrorObject(), "Inbox")
+        
+        self.assertFalse(result.error)
+        self.assertEqual(result.subject, "")
+        self.assertEqual(result.importance, 1)
+        self.assertIsNone(result.received_time)
+        self.assertEqual(result.attachment_count, 0)
     
     def test_process_empty_recipients_collection(self):
         """Test processing when recipients collection is empty."""
-        to_list, cc_list, bcc_list = self.processor._process_recipients([])
+        mail_item = SimpleNamespace(Recipients=_Collection())
         
-        self.assertEqual(len(to_list), 0)
-        self.assertEqual(len(cc_list), 0)
-        self.assertEqual(len(bcc_list), 0)
+        self.assertEqual(self.processor._extract_recipients(mail_item), ("", "", ""))
     
     def test_process_empty_attachments_collection(self):
         """Test processing when attachments collection is empty."""
-        count, names, total_size = self.processor._process_attachments([])
+        info = self.processor._process_attachments(SimpleNamespace(Attachments=_Collection()))
         
-        self.assertEqual(count, 0)
-        self.assertEqual(len(names), 0)
-        self.assertEqual(total_size, 0)
+        self.assertFalse(info['has_attachments'])
+        self.assertEqual(info['attachment_count'], 0)
+        self.assertEqual(info['attachment_names'], "")
+        self.assertEqual(info['attachment_sizes'], "")
     
-    def test_recipient_type_mapping(self):
-        """Test that recipient types are correctly mapped."""
-        recipients = []
-        
-        # Test various recipient types
-        for recipient_type in range(1, 4):  # 1=TO, 2=CC, 3=BCC
-            recipient = Mock()
-            recipient.Name = f"Person {recipient_type}"
-            recipient.Address = f"person{recipient_type}@example.com"
-            recipient.Type = recipient_type
-            recipients.append(recipient)
-        
-        to_list, cc_list, bcc_list = self.processor._process_recipients(recipients)
-        
-        # Verify correct type mapping
-        self.assertEqual(len(to_list), 1)
-        self.assertEqual(len(cc_list), 1)
-        self.assertEqual(len(bcc_list), 1)
-        
-        self.assertIn("person1@example.com", to_list)
-        self.assertIn("person2@example.com", cc_list)
-        self.assertIn("person3@example.com", bcc_list)
-    
-    @patch('outlook2ai.core.email_processor.logger')
-    def test_logging_on_error(self, mock_logger):
+    def test_logging_on_error(self):
         """Test that errors are properly logged."""
-        # Create email that will cause an error
-        error_email = Mock()
-        error_email.Subject = Mock(side_effect=Exception("Test exception"))
-        
-        result = self.processor.process_email_item(error_email)
+        with patch.object(self.processor.text_processor, 'process_email_body',
+                          side_effect=Exception("Test exception")):
+            with self.assertLogs('outlook2ai.core.email_processor', level='ERROR') as logs:
+                result = self.processor.process_email_item(self.mock_email, "Inbox")
         
         # Verify error was logged
-        mock_logger.error.assert_called()
-        self.assertIsNone(result)
+        self.assertIn("Test exception", logs.output[0])
+        self.assertTrue(result.error)
     
     def test_text_processor_integration(self):
-        """Test integration with text processor if available."""
+        """Test that body analysis comes from the text processor."""
         with patch('outlook2ai.core.email_processor.TextProcessor') as mock_text_processor:
             # Mock the text processor
             mock_processor_instance = Mock()
-            mock_processor_instance.clean_html.return_value = "Cleaned HTML"
-            mock_processor_instance.extract_text_statistics.return_value = {
-                'word_count': 10,
-                'char_count': 50
+            mock_processor_instance.process_email_body.return_value = {
+                'cleaned_text': "Cleaned text",
+                'statistics': {'word_count': 10, 'character_count': 50},
             }
             mock_text_processor.return_value = mock_processor_instance
             
@@ -308,38 +339,95 @@ class TestEmailProcessor(unittest.TestCase):
             processor = EmailProcessor()
             
             # Process email
-            result = processor.process_email_item(self.mock_email)
-            
-            # Verify text processor was used
-            self.assertIsNotNone(result)
+            result = processor.process_email_item(self.mock_email, "Inbox")
+        
+        # Verify text processor was used
+        mock_processor_instance.process_email_body.assert_called_once()
+        self.assertEqual(result.cleaned_text, "Cleaned text")
+        self.assertEqual(result.statistics, {'word_count': 10, 'character_count': 50})
     
     def test_malformed_datetime_handling(self):
         """Test handling of malformed datetime objects."""
-        malformed_email = Mock()
-        malformed_email.Subject = "Test"
-        malformed_email.Body = "Test body"
-        malformed_email.HTMLBody = ""
-        malformed_email.ReceivedTime = "Not a datetime"  # Invalid datetime
-        malformed_email.SentOn = None  # Null datetime
-        malformed_email.Size = 100
-        malformed_email.UnRead = False
-        malformed_email.Importance = 1
-        malformed_email.Sensitivity = 0
-        malformed_email.SenderName = "Test Sender"
-        malformed_email.SenderEmailAddress = "test@example.com"
-        malformed_email.ConversationID = ""
-        malformed_email.ConversationTopic = ""
-        malformed_email.EntryID = ""
-        malformed_email.Categories = ""
-        malformed_email.Recipients = []
-        malformed_email.Attachments = []
-        
-        result = self.processor.process_email_item(malformed_email)
-        
-        # Should still process successfully with default datetime values
-        self.assertIsNotNone(result)
+        malformed_email = SimpleNamespace(
+            Subject="Test",
+            Body="Test body",
+            HTMLBody="",
+            ReceivedTime="Not a datetime",  # Invalid datetime
+            SentOn=None,  # Null datetime
+            Size=100,
+            UnRead=False,
+            Importance=1,
+            SenderName="Test Sender",
+            SenderEmailAddress="test@example.com",
+            ConversationID="",
+            ConversationTopic="",
+            EntryID="",
+            Categories="",
+            Recipients=_Collection(),
+            Attachments=_Collection(),
+        )
+        
+        result = self.processor.process_email_item(malformed_email, "Inbox")
+        
+        # Should still process successfully with empty datetime values
+        self.assertFalse(result.error)
         self.assertEqual(result['subject'], "Test")
+        self.assertIsNone(result['received_time'])
+        self.assertIsNone(result['sent_time'])
+
+
+@pytest.fixture(scope="module")
+def processor():
+    """Email processor shared by the module's pytest tests."""
+    return EmailProcessor()
+
+
+_RECIPIENT_BUCKETS = ("to", "cc", "bcc")
+
 
+@pytest.mark.parametrize("recipient_type,bucket", [(1, "to"), (2, "cc"), (3, "bcc")])  # 1=TO, 2=CC, 3=BCC
+def test_recipient_routing(processor, recipient_type, bucket):
+    """Test that each recipient type is routed to its own list."""
+    mail_item = SimpleNamespace(Recipients=[
+        SimpleNamespace(Name="Person", Address="person@example.com", Type=recipient_type),
+    ])
+    
+    routed = dict(zip(_RECIPIENT_BUCKETS, processor._extract_recipients(mail_item)))
+    
+    assert routed == {
+        name: "Person <person@example.com>" if name == bucket else ""
+        for name in _RECIPIENT_BUCKETS
+    }
+
+
+def test_recipient_routing_all_types(processor):
+    """Test routing recipients of all types (TO, CC, BCC) from one mail item."""
+    mail_item = SimpleNamespace(Recipients=[
+        SimpleNamespace(Name="To Person", Address="to@example.com", Type=1),
+        SimpleNamespace(Name="CC Person", Address="cc@example.com", Type=2),
+        SimpleNamespace(Name="BCC Person", Address="bcc@example.com", Type=3),
+        SimpleNamespace(Name="Second To", Address="to2@example.com", Type=1),
+    ])
+    
+    assert processor._extract_recipients(mail_item) == (
+        "To Person <to@example.com>; Second To <to2@example.com>",
+        "CC Person <cc@example.com>",
+        "BCC Person <bcc@example.com>",
+    )
+
+
+@pytest.mark.parametrize("name,address,expected", [
+    ("person@example.com", "person@example.com", "person@example.com"),  # Name repeats the address
+    ("", "person@example.com", "person@example.com"),                    # No display name
+    ("No Email Person", "", ""),                                         # No address: skipped
+])
+def test_recipient_formatting(processor, name, address, expected):
+    """Test how recipient names and addresses are combined."""
+    mail_item = SimpleNamespace(Recipients=[SimpleNamespace(Name=name, Address=address, Type=1)])
+    
+    to_recipients, cc_recipients, bcc_recipients = processor._extract_recipients(mail_item)
+    
+    assert (to_recipients, cc_recipients, bcc_recipients) == (expected, "", "")
 
 if __name__ == '__main__':
     # Configure test runner
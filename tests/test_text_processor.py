@@ -0,0 +1,211 @@
+"""
+Test suite for text_processor module.
+
+This module contains unit tests for the TextProcessor class, covering body
+processing, its cache and HTML cleaning.
+"""
+
+import re
+import time
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from outlook2ai.processors import text_processor
+from outlook2ai.processors.text_processor import TextProcessor
+
+
+class TestTextProcessor(unittest.TestCase):
+    """Test cases for TextProcessor class."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.processor = TextProcessor()
+    
+    def test_process_email_body_reuses_cached_analysis(self):
+        """Test that an identical body is only analyzed once."""
+        with patch.object(self.processor, '_analyze_body', wraps=self.processor._analyze_body) as analyze:
+            first = self.processor.process_email_body('', "Meeting at noon, call 555-123-4567")
+            second = self.processor.process_email_body('', "Meeting at noon, call 555-123-4567")
+        
+        analyze.assert_called_once()
+        self.assertEqual(first, second)
+        self.assertEqual(first['phone_numbers'], ["555-123-4567"])
+        
+        # Callers get their own copies of the cached lists
+        first['phone_numbers'].append("other")
+        self.assertEqual(second['phone_numbers'], ["555-123-4567"])
+    
+    def test_body_cache_keyed_by_digest(self):
+        """Test that the cache holds body digests rather than the bodies."""
+        body = "Quarterly report attached. " * 100
+        
+        self.processor.process_email_body('', body)
+        
+        self.assertEqual(len(self.processor._body_cache), 1)
+        key = next(iter(self.processor._body_cache))
+        self.assertIsInstance(key, bytes)
+        self.assertEqual(len(key), 16)
+    
+    def test_body_cache_bounded(self):
+        """Test that the cache evicts the oldest analyses past its limits."""
+        with patch.object(text_processor, '_BODY_CACHE_SIZE', 2):
+            for i in range(3):
+                self.processor.process_email_body('', f"Body number {i}")
+        
+        self.assertEqual(len(self.processor._body_cache), 2)
+        
+        # Cleaned and LLM text of 15 characters each fit the 40 character
+        # cap only once the older entries are evicted
+        with patch.object(text_processor, '_BODY_CACHE_CHARS', 40):
+            self.processor.process_email_body('', "y" * 15)
+        
+        self.assertEqual(len(self.processor._body_cache), 1)
+        
+        self.assertLessEqual(self.processor._body_cache_chars, 40)
+        self.assertEqual(
+            self.processor._body_cache_chars,
+            sum(chars for _, chars in self.processor._body_cache.values())
+        )
+
+    
+    def test_clean_html_content_skips_large_style_block(self):
+        """Test that a long head of styles does not push the text out of the parsed window."""
+        html_body = (
+            "<html><head><style>"
+            + "p.MsoNormal { margin: 0cm; font-family: Calibri; }\n" * 2000
+            + "</style></head><body>"
+            + "<!--[if gte mso 9]><xml><o:shapedefaults v:ext=\"edit\"/></xml><![endif]-->"
+            + "<p>Please review the attached budget.</p></body></html>"
+        )
+        
+        text = self.processor.clean_html_content(html_body, max_chars=100)
+        
+        self.assertEqual(text, "Please review the attached budget.")
+        
+        # HTML-only email bodies go through the same window
+        result = self.processor.process_email_body(html_body, "")
+        self.assertEqual(result['cleaned_html'], "Please review the attached budget.")
+    
+    def test_clean_html_content_unclosed_tags_are_linear(self):
+        """Test that many unclosed style tags are cleaned without rescanning the document."""
+        for tail in ("<style>x" * 16000, "<style" * 16000, "<!--x" * 16000):
+            with self.subTest(tail=tail[:8]):
+                start = time.perf_counter()
+                text = self.processor.clean_html_content("<p>Hello</p>" + tail, max_chars=100)
+                elapsed = time.perf_counter() - start
+                
+                self.assertTrue(text.startswith("Hello"))
+                self.assertLess(elapsed, 2.0)
+    
+    def test_clean_html_series_matches_process_email_body(self):
+        """Test that bulk HTML cleaning drops the same Outlook markup as per-email cleaning."""
+        html_body = (
+            "<html><head><title>Secret title</title>"
+            "<!--[if gte mso 9]><xml><o:OfficeDocumentSettings>officejunk</o:OfficeDocumentSettings></xml><![endif]-->"
+            "<style>p.MsoNormal { margin: 0cm; }</style></head>"
+            "<body><!--[if mso]><v:shape>vmljunk</v:shape><![endif]-->"
+            "<p class=MsoNormal>Body</p>\n<p>See you &amp; thanks</p></body></html>"
+        )
+        
+        bulk = self.processor.clean_html_series(pd.Series([html_body]))[0]
+        
+        self.assertEqual(bulk, "Body See you & thanks")
+        self.assertEqual(bulk, self.processor.process_email_body(html_body, "")['cleaned_html'])
+
+
+# Body used to check every optional backend against its fallback
+_ENTITY_TEXT = (
+    "Contact jane.doe@example.com or call 555-123-4567, "
+    "details at https://example.com/report?id=7 and 555.987.6543."
+)
+_EXPECTED_ENTITIES = (
+    ["jane.doe@example.com"],
+    ["555-123-4567", "555.987.6543"],
+    ["https://example.com/report?id=7"],
+)
+
+
+class TestOptionalBackends(unittest.TestCase):
+    """Test the accelerated backends (pip install outlook2ai[fast]) and their fallbacks."""
+    
+    HTML_BODY = (
+        "<html><head><style>p { color: red; }</style></head>"
+        "<body><p>Hello <b>World</b> &amp; friends</p><script>track();</script></body></html>"
+    )
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.processor = TextProcessor()
+    
+    def _clean_with(self, lexbor, beautiful_soup):
+        """Clean HTML_BODY with the given parser classes installed."""
+        with patch.object(text_processor, 'LexborHTMLParser', lexbor), \
+                patch.object(text_processor, 'BeautifulSoup', beautiful_soup):
+            return self.processor.clean_html_content(self.HTML_BODY, max_chars=1000)
+    
+    def test_html_regex_fallback(self):
+        """Test HTML cleaning with neither parser installed."""
+        self.assertEqual(self._clean_with(None, None), "Hello World & friends")
+    
+    @unittest.skipIf(text_processor.BeautifulSoup is None, "beautifulsoup4 not installed")
+    def test_html_beautifulsoup(self):
+        """Test HTML cleaning with BeautifulSoup."""
+        self.assertEqual(self._clean_with(None, text_processor.BeautifulSoup), "Hello World & friends")
+    
+    @unittest.skipIf(text_processor.LexborHTMLParser is None, "selectolax not installed")
+    def test_html_lexbor(self):
+        """Test HTML cleaning with selectolax's lexbor parser."""
+        self.assertEqual(self._clean_with(text_processor.LexborHTMLParser, None), "Hello World & friends")
+    
+    def test_entities_without_hyperscan(self):
+        """Test entity extraction with re only."""
+        with patch.object(text_processor, '_HS_DB', None):
+            self.assertEqual(self.processor.extract_entities(_ENTITY_TEXT), _EXPECTED_ENTITIES)
+    
+    @unittest.skipIf(text_processor._HS_DB is None, "hyperscan not installed")
+    def test_entities_with_hyperscan(self):
+        """Test that the Hyperscan prefilter finds the same entities as re."""
+        self.assertEqual(self.processor.extract_entities(_ENTITY_TEXT), _EXPECTED_ENTITIES)
+        
+        # Entity types the scan does not see are never searched for
+        with patch.object(self.processor, 'extract_phone_numbers') as extract_phone_numbers:
+            emails, phones, urls = self.processor.extract_entities("Mail jane.doe@example.com today")
+        
+        self.assertEqual((emails, phones, urls), (["jane.doe@example.com"], [], []))
+        extract_phone_numbers.assert_not_called()
+    
+    @unittest.skipIf(text_processor.re2 is None, "google-re2 not installed")
+    def test_entity_patterns_match_stdlib(self):
+        """Test that the RE2 email and URL patterns match as the stdlib re versions do."""
+        samples = [
+            _ENTITY_TEXT,
+            "no entities here",
+            "a.b@c.de,x_y+z@q-r.io;http://a.b/c(d)!*%2F e@f",
+            "é@example.com ü.ser@exämple.com user@example.c0m",
+        ]
+        for compiled, pattern in ((text_processor._EMAIL_RE, text_processor._EMAIL_PATTERN),
+                                  (text_processor._URL_RE, text_processor._URL_PATTERN)):
+            stdlib = re.compile(pattern)
+            for sample in samples:
+                with self.subTest(pattern=pattern, sample=sample):
+                    self.assertEqual(compiled.findall(sample), stdlib.findall(sample))
+    
+    @unittest.skipIf(text_processor.re2 is None, "google-re2 not installed")
+    def test_email_pattern_ascii_word_boundary(self):
+        """Test that RE2 finds an address next to a non-ASCII letter, where re does not."""
+        # RE2's \b only treats ASCII as word characters, so 'é' bounds the address
+        for sample in ("éjane@example.com", "jane@example.comé"):
+            with self.subTest(sample=sample):
+                self.assertEqual(text_processor._EMAIL_RE.findall(sample), ["jane@example.com"])
+                self.assertEqual(re.findall(text_processor._EMAIL_PATTERN, sample), [])
+    
+    @unittest.skipIf(text_processor.re2 is None, "google-re2 not installed")
+    def test_entity_patterns_use_re2(self):
+        """Test that the email and URL patterns are compiled with RE2 when it is installed."""
+        self.assertNotIsInstance(text_processor._EMAIL_RE, re.Pattern)
+        self.assertNotIsInstance(text_processor._URL_RE, re.Pattern)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)